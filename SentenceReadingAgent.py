@@ -29,7 +29,972 @@ Disclosure of AI assistance:
     Code was authored by myself.
 """
 
+import collections
+import functools
+import itertools
+import logging
 import re
+import sys
+from types import MappingProxyType
+
+_logger = logging.getLogger(__name__)
+
+# POS (Part of Speech): tells you if a word is a NOUN, VERB, ADJ, etc.
+# Lemma: base form of the word ("brought" → "bring")
+# Packed as one "word POS lemma" row per entry and parsed once at import, so the
+# module builds a single string constant instead of hundreds of small dict literals.
+_LEXICON = """
+Serena   PROPN serena
+Andrew   PROPN andrew
+Bobbie   PROPN bobbie
+Cason    PROPN cason
+David    PROPN david
+Farzana  PROPN farzana
+Frank    PROPN frank
+Hannah   PROPN hannah
+Ida      PROPN ida
+Irene    PROPN irene
+Jim      PROPN jim
+Jose     PROPN jose
+Keith    PROPN keith
+Laura    PROPN laura
+Lucy     PROPN lucy
+Meredith PROPN meredith
+Nick     PROPN nick
+Ada      PROPN ada
+Yeeling  PROPN yeeling
+Yan      PROPN yan
+the      PRON  the
+of       ADP   of
+to       PART  to
+and      CCONJ and
+a        PRON  a
+in       ADP   in
+is       AUX   be
+it       PRON  it
+you      PRON  you
+that     SCONJ that
+he       PRON  he
+was      AUX   be
+for      ADP   for
+on       ADP   on
+are      AUX   be
+with     ADP   with
+as       ADP   as
+I        PRON  I
+his      PRON  his
+they     PRON  they
+be       AUX   be
+at       ADP   at
+one      NUM   one
+have     VERB  have
+this     PRON  this
+from     ADP   from
+or       CCONJ or
+had      VERB  have
+by       ADP   by
+hot      ADJ   hot
+but      CCONJ but
+some     PRON  some
+what     PRON  what
+there    PRON  there
+we       PRON  we
+can      AUX   can
+out      ADV   out
+other    ADJ   other
+were     AUX   be
+all      PRON  all
+your     PRON  your
+when     SCONJ when
+up       ADV   up
+use      NOUN  use
+word     NOUN  word
+how      SCONJ how
+said     VERB  say
+an       PRON  an
+each     PRON  each
+she      PRON  she
+which    PRON  which
+do       VERB  do
+their    PRON  their
+time     NOUN  time
+if       SCONJ if
+will     AUX   will
+way      NOUN  way
+about    ADV   about
+many     ADJ   many
+then     ADV   then
+them     PRON  they
+would    AUX   would
+write    VERB  write
+wrote    VERB  write
+like     INTJ  like
+so       ADV   so
+these    PRON  these
+her      PRON  she
+long     ADJ   long
+make     VERB  make
+thing    NOUN  thing
+see      VERB  see
+him      PRON  he
+two      NUM   two
+has      VERB  have
+look     VERB  look
+more     ADV   more
+day      NOUN  day
+could    AUX   could
+go       VERB  go
+come     VERB  come
+did      VERB  do
+my       PRON  my
+sound    VERB  sound
+no       INTJ  no
+most     ADV   most
+number   NOUN  number
+who      PRON  who
+over     ADV   over
+know     VERB  know
+water    NOUN  water
+than     ADP   than
+call     VERB  call
+first    ADV   first
+people   NOUN  people
+may      AUX   may
+down     ADV   down
+side     NOUN  side
+been     AUX   be
+now      ADV   now
+find     VERB  find
+any      PRON  any
+new      ADJ   new
+work     VERB  work
+part     NOUN  part
+take     VERB  take
+get      VERB  get
+place    NOUN  place
+made     VERB  make
+live     ADJ   live
+where    SCONJ where
+after    ADP   after
+back     ADV   back
+little   ADJ   little
+only     ADV   only
+round    ADJ   round
+man      NOUN  man
+year     NOUN  year
+came     VERB  come
+show     VERB  show
+every    DET   every
+good     ADJ   good
+me       PRON  I
+give     VERB  give
+our      PRON  our
+under    ADP   under
+name     NOUN  name
+very     ADV   very
+through  ADP   through
+just     ADV   just
+form     NOUN  form
+much     ADJ   much
+great    ADJ   great
+think    VERB  think
+say      VERB  say
+help     VERB  help
+low      ADJ   low
+line     NOUN  line
+before   ADP   before
+turn     VERB  turn
+cause    VERB  cause
+same     ADJ   same
+mean     VERB  mean
+differ   VERB  differ
+move     VERB  move
+right    INTJ  right
+boy      NOUN  boy
+old      ADJ   old
+too      ADV   too
+does     VERB  do
+tell     VERB  tell
+sentence NOUN  sentence
+set      VERB  set
+three    NUM   three
+want     VERB  want
+air      NOUN  air
+well     ADV   well
+also     ADV   also
+play     VERB  play
+small    ADJ   small
+end      NOUN  end
+put      VERB  put
+home     NOUN  home
+read     VERB  read
+hand     NOUN  hand
+port     NOUN  port
+large    ADJ   large
+spell    VERB  spell
+add      VERB  add
+even     ADV   even
+land     NOUN  land
+here     ADV   here
+must     AUX   must
+big      ADJ   big
+high     ADJ   high
+such     ADJ   such
+follow   VERB  follow
+act      NOUN  act
+why      SCONJ why
+ask      VERB  ask
+men      NOUN  man
+change   VERB  change
+went     VERB  go
+light    NOUN  light
+kind     ADV   kind
+off      ADP   off
+need     VERB  need
+house    PROPN house
+picture  NOUN  picture
+try      VERB  try
+us       PRON  we
+again    ADV   again
+animal   NOUN  animal
+point    NOUN  point
+mother   NOUN  mother
+world    NOUN  world
+near     ADP   near
+build    VERB  build
+self     NOUN  self
+earth    NOUN  earth
+father   PROPN father
+head     NOUN  head
+stand    VERB  stand
+own      ADJ   own
+page     NOUN  page
+should   AUX   should
+country  NOUN  country
+found    VERB  find
+answer   VERB  answer
+school   NOUN  school
+grow     VERB  grow
+study    NOUN  study
+still    ADV   still
+learn    VERB  learn
+plant    NOUN  plant
+cover    VERB  cover
+food     NOUN  food
+sun      PROPN sun
+four     NUM   four
+thought  VERB  think
+let      VERB  let
+keep     VERB  keep
+eye      NOUN  eye
+never    ADV   never
+last     ADJ   last
+door     NOUN  door
+between  ADP   between
+city     NOUN  city
+tree     NOUN  tree
+cross    VERB  cross
+since    SCONJ since
+hard     ADJ   hard
+start    VERB  start
+might    AUX   might
+story    NOUN  story
+saw      VERB  see
+far      ADV   far
+sea      NOUN  sea
+draw     VERB  draw
+left     VERB  leave
+late     ADV   late
+run      VERB  run
+don't    PART  not
+while    SCONJ while
+press    NOUN  press
+close    ADV   close
+night    NOUN  night
+real     ADJ   real
+life     NOUN  life
+few      ADJ   few
+stop     VERB  stop
+open     ADJ   open
+seem     VERB  seem
+together ADV   together
+next     ADJ   next
+white    ADJ   white
+children NOUN  child
+begin    VERB  begin
+got      VERB  get
+walk     VERB  walk
+example  NOUN  example
+ease     NOUN  ease
+paper    NOUN  paper
+often    ADV   often
+always   ADV   always
+music    NOUN  music
+those    PRON  those
+both     PRON  both
+mark     PROPN mark
+book     PROPN book
+letter   NOUN  letter
+until    ADP   until
+mile     NOUN  mile
+river    NOUN  river
+car      NOUN  car
+feet     NOUN  foot
+care     VERB  care
+second   ADJ   second
+group    NOUN  group
+carry    VERB  carry
+took     VERB  take
+rain     NOUN  rain
+eat      VERB  eat
+room     NOUN  room
+friend   NOUN  friend
+began    VERB  begin
+idea     NOUN  idea
+fish     NOUN  fish
+mountain NOUN  mountain
+north    NOUN  north
+once     ADV   once
+base     NOUN  base
+hear     VERB  hear
+horse    NOUN  horse
+cut      VERB  cut
+sure     ADJ   sure
+watch    VERB  watch
+color    NOUN  color
+face     VERB  face
+wood     NOUN  wood
+main     ADJ   main
+enough   ADV   enough
+plain    ADV   plain
+girl     NOUN  girl
+usual    ADJ   usual
+young    ADJ   young
+ready    ADJ   ready
+above    ADV   above
+ever     ADV   ever
+red      ADJ   red
+list     NOUN  list
+though   SCONJ though
+feel     VERB  feel
+talk     VERB  talk
+bird     NOUN  bird
+soon     ADV   soon
+body     NOUN  body
+dog      NOUN  dog
+dogs     NOUN  dog
+dog's    PART  's
+family   NOUN  family
+direct   ADJ   direct
+pose     VERB  pose
+leave    VERB  leave
+song     NOUN  song
+measure  NOUN  measure
+state    NOUN  state
+product  NOUN  product
+black    ADJ   black
+short    ADJ   short
+numeral  ADJ   numeral
+class    NOUN  class
+wind     NOUN  wind
+question NOUN  question
+happen   VERB  happen
+complete ADJ   complete
+ship     NOUN  ship
+area     NOUN  area
+half     ADJ   half
+rock     NOUN  rock
+order    NOUN  order
+fire     NOUN  fire
+south    ADJ   south
+problem  NOUN  problem
+piece    NOUN  piece
+told     VERB  tell
+knew     VERB  know
+pass     VERB  pass
+farm     NOUN  farm
+top      ADJ   top
+whole    ADJ   whole
+king     NOUN  king
+size     NOUN  size
+heard    VERB  hear
+best     ADJ   well
+hour     NOUN  hour
+better   ADV   well
+true     ADJ   true
+during   ADP   during
+hundred  NUM   hundred
+am       AUX   be
+remember VERB  remember
+step     VERB  step
+early    ADV   early
+hold     VERB  hold
+west     PROPN west
+ground   NOUN  ground
+interest NOUN  interest
+reach    VERB  reach
+fast     ADJ   fast
+five     NUM   five
+sing     VERB  sing
+sings    VERB  sing
+listen   VERB  listen
+six      NUM   six
+table    NOUN  table
+travel   NOUN  travel
+less     ADV   less
+morning  NOUN  morning
+ten      NUM   ten
+simple   ADJ   simple
+several  ADJ   several
+vowel    NOUN  vowel
+toward   ADP   toward
+war      NOUN  war
+lay      VERB  lie
+against  ADP   against
+pattern  NOUN  pattern
+slow     ADJ   slow
+center   PROPN center
+love     NOUN  love
+person   NOUN  person
+money    NOUN  money
+serve    VERB  serve
+appear   VERB  appear
+road     NOUN  road
+map      NOUN  map
+science  NOUN  science
+rule     NOUN  rule
+govern   VERB  govern
+pull     VERB  pull
+cold     ADJ   cold
+notice   VERB  notice
+voice    NOUN  voice
+fall     NOUN  fall
+power    NOUN  power
+town     NOUN  town
+fine     ADJ   fine
+certain  ADJ   certain
+fly      VERB  fly
+unit     NOUN  unit
+lead     VERB  lead
+cry      VERB  cry
+dark     ADJ   dark
+machine  NOUN  machine
+note     NOUN  note
+wait     VERB  wait
+plan     NOUN  plan
+figure   NOUN  figure
+star     PROPN star
+box      PROPN box
+noun     PROPN noun
+field    NOUN  field
+rest     VERB  rest
+correct  ADJ   correct
+able     ADJ   able
+pound    NOUN  pound
+done     VERB  do
+beauty   NOUN  beauty
+drive    VERB  drive
+stood    VERB  stand
+contain  VERB  contain
+front    NOUN  front
+teach    VERB  teach
+week     NOUN  week
+final    ADJ   final
+gave     VERB  give
+green    ADJ   green
+oh       INTJ  oh
+quick    ADJ   quick
+develop  VERB  develop
+sleep    NOUN  sleep
+warm     ADJ   warm
+free     ADJ   free
+minute   NOUN  minute
+strong   ADJ   strong
+special  ADJ   special
+mind     VERB  mind
+behind   ADV   behind
+clear    ADV   clear
+tail     NOUN  tail
+produce  VERB  produce
+fact     NOUN  fact
+street   NOUN  street
+inch     NOUN  inch
+lot      NOUN  lot
+nothing  PRON  nothing
+course   NOUN  course
+stay     VERB  stay
+wheel    NOUN  wheel
+full     ADJ   full
+force    NOUN  force
+blue     ADJ   blue
+object   VERB  object
+decide   VERB  decide
+surface  NOUN  surface
+deep     ADJ   deep
+moon     NOUN  moon
+island   NOUN  island
+foot     NOUN  foot
+yet      ADV   yet
+busy     ADJ   busy
+test     NOUN  test
+record   PROPN record
+boat     NOUN  boat
+common   ADJ   common
+gold     ADJ   gold
+possible ADJ   possible
+plane    NOUN  plane
+age      NOUN  age
+dry      ADJ   dry
+wonder   NOUN  wonder
+laugh    VERB  laugh
+thousand NUM   thousand
+ago      ADV   ago
+ran      VERB  run
+check    VERB  check
+game     NOUN  game
+shape    NOUN  shape
+yes      INTJ  yes
+cool     ADJ   cool
+miss     VERB  miss
+brought  VERB  bring
+heat     NOUN  heat
+snow     NOUN  snow
+bed      NOUN  bed
+bring    VERB  bring
+sit      VERB  sit
+perhaps  ADV   perhaps
+fill     VERB  fill
+east     NOUN  east
+weight   NOUN  weight
+language NOUN  language
+among    ADP   among
+adult    NOUN  adult
+adults   NOUN  adult
+yellow   ADJ   yellow
+orange   ADJ   orange
+purple   ADJ   purple
+brown    ADJ   brown
+pink     ADJ   pink
+gray     ADJ   gray
+grey     ADJ   grey
+silver   ADJ   silver
+tiny     ADJ   tiny
+huge     ADJ   huge
+tall     ADJ   tall
+wide     ADJ   wide
+narrow   ADJ   narrow
+thick    ADJ   thick
+thin     ADJ   thin
+ancient  ADJ   ancient
+modern   ADJ   modern
+fresh    ADJ   fresh
+"""
+_ROWS = tuple(zip(*[iter(_LEXICON.split())] * 3, strict=True))  # (word, pos, lemma)
+
+# Flat word -> POS and word -> lemma lookups so tagging is a single hash probe.
+# Keys are lower-cased so "Red"/"red" share one entry and callers look up word.lower().
+# Tags and lemmas are interned so repeated values share one string object.
+_POS = {word.lower(): sys.intern(pos) for word, pos, _ in _ROWS}
+_LEMMA = {word.lower(): sys.intern(lemma) for word, _, lemma in _ROWS}
+
+
+class _CIDict(dict):
+    """A dict with lower-cased keys that folds the case of every lookup key."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return super().__getitem__(key.lower())
+
+    def __contains__(self, key):
+        return super().__contains__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+# word -> WordInfo(pos, lemma) view, kept for callers of SentenceReadingAgent.WORD_DATA.
+# Keys are case-folded, so WORD_DATA["Red"] and WORD_DATA["red"] hit the same entry.
+# Words with the same (pos, lemma) share one entry object (e.g. is/was/are/were → be).
+WordInfo = collections.namedtuple("WordInfo", ("pos", "lemma"))
+_ENTRIES = {}
+_WORD_DATA = _CIDict(
+    (word.lower(), _ENTRIES.setdefault((pos, lemma), WordInfo(sys.intern(pos), sys.intern(lemma))))
+    for word, pos, lemma in _ROWS
+)
+# Returned by lookups that miss the lexicon, so a miss costs no allocation.
+_UNK = sys.intern("UNK")
+# Words the lexicon tags as verbs, for single-probe "is this a verb?" checks.
+_VERBS = frozenset(word for word, pos in _POS.items() if pos == "VERB")
+
+# Closed word classes the tagger consults; shared with the agent as class attributes.
+_NAMES = frozenset(
+    {
+        "ada",
+        "andrew",
+        "bobbie",
+        "cason",
+        "david",
+        "farzana",
+        "frank",
+        "hannah",
+        "ida",
+        "irene",
+        "jim",
+        "jose",
+        "keith",
+        "laura",
+        "lucy",
+        "meredith",
+        "nick",
+        "serena",
+        "yan",
+        "yeeling",
+    }
+)
+_TIME_PATTERN = re.compile(r"\d{1,2}:\d{2}(?:AM|PM)?", re.IGNORECASE)
+_TIME_WORDS = frozenset(
+    {
+        "monday",
+        "tuesday",
+        "wednesday",
+        "thursday",
+        "friday",
+        "saturday",
+        "sunday",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+        "today",
+        "tomorrow",
+        "yesterday",
+        "now",
+        "soon",
+        "later",
+        "recently",
+        "morning",
+        "afternoon",
+        "evening",
+        "night",
+        "noon",
+        "midnight",
+        "spring",
+        "summer",
+        "fall",
+        "autumn",
+        "winter",
+        "week",
+        "month",
+        "year",
+        "day",
+        "hour",
+        "minute",
+        "second",
+    }
+)
+_NUM_WORDS = frozenset(
+    {
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+        "six",
+        "seven",
+        "eight",
+        "nine",
+        "ten",
+        "eleven",
+        "twelve",
+        "thirteen",
+        "fourteen",
+        "fifteen",
+        "sixteen",
+        "seventeen",
+        "eighteen",
+        "nineteen",
+        "twenty",
+        "thirty",
+        "forty",
+        "fifty",
+        "sixty",
+        "seventy",
+        "eighty",
+        "ninety",
+        "hundred",
+        "thousand",
+        "million",
+        "billion",
+    }
+)
+# Punctuation deleted before splitting on whitespace. Colons, apostrophes and hyphens
+# are kept so "8:00AM", "don't"/"dog's" and "twenty-one" stay whole tokens; periods are
+# only stripped from the end of the text so "3.5" and "a.m" stay whole too.
+_PUNCT_TABLE = str.maketrans("", "", ',!?;"')
+# Determiners that mark the next word as a noun ("a play", "the best").
+_DETERMINERS = frozenset(("a", "an", "the", "this", "that", "some"))
+# Indefinite articles that open a spelled-out quantity ("a thousand").
+_INDEF_ART = frozenset(("a", "an"))
+
+
+def _build_suffix_trie(rules: tuple[tuple[str, str, int], ...]) -> dict:
+    """Build a trie of reversed suffixes whose accepting nodes hold (pos, min_length).
+
+    Args:
+        rules: (suffix, pos, min_length) triples; a word must be at least min_length long.
+    """
+    trie = {}
+    for suffix, pos, min_length in rules:
+        node = trie
+        for ch in reversed(suffix):
+            node = node.setdefault(ch, {})
+        node[""] = (pos, min_length)  # "" never collides with a character edge
+    return trie
+
+
+# Morphology backoff for unknown words: walking the trie over a word's last characters
+# finds its suffix in one pass instead of three endswith() scans.
+_SUFFIX_TRIE = _build_suffix_trie(
+    (
+        ("tion", "NOUN", 0),
+        ("ness", "NOUN", 0),
+        ("ment", "NOUN", 0),
+        ("ity", "NOUN", 0),
+        ("er", "NOUN", 0),
+        ("or", "NOUN", 0),
+        ("ly", "ADV", 0),
+        ("ed", "VERB", 5),
+        ("ing", "VERB", 5),
+    )
+)
+
+# Closed keyword classes used by question classification.
+_WHO_WORDS = frozenset(("who", "whom"))
+_BE_WORDS = frozenset(("is", "was", "are", "were", "be", "been"))
+_CLASSIFIER_NOUNS = frozenset(
+    ("color", "animal", "size", "kind", "type", "shape", "brand", "style")
+)
+_QUANTITY_WORDS = frozenset(("many", "much"))
+
+# Closed word classes used by frame extraction and question classification.
+_DIST = frozenset({"mile", "foot", "feet", "meter", "kilometer", "inch", "yard"})
+_TIME_MARKERS = frozenset({"this", "last", "next", "every", "on"})
+_CLAUSE_MARKERS = frozenset({"when", "while", "if", "because", "although", "unless"})
+_W_MOVEMENT = frozenset({"get", "go", "travel", "arrive", "walk", "drive", "come"})
+_DIRECTIONS = frozenset({"east", "west", "north", "south"})
+_QUANTS = frozenset({"all", "some", "every", "most", "few", "none"})
+_SUB_PRONOUNS = frozenset({"i", "he", "she", "we", "they"})
+_OBJ_PRONOUNS = frozenset(
+    {
+        "me",
+        "him",
+        "us",
+        "them",
+    }
+)  # removed 'her' because it is also posessive :(
+# BEGIN CODE REFERENCED FROM https://www.aprendeinglesenleganes.com/resources/DITRANSITIVE%20VERBS%20(LIST)%20.pdf
+_DITRANSITIVE = frozenset(
+    {
+        "give",
+        "gave",
+        "given",
+        "tell",
+        "told",
+        "show",
+        "showed",
+        "shown",
+        "send",
+        "sent",
+        "bring",
+        "brought",
+        "write",
+        "wrote",
+        "written",
+        "teach",
+        "taught",
+        "read",
+        "hand",
+        "handed",
+        "pass",
+        "passed",
+        "sell",
+        "sold",
+        "lend",
+        "lent",
+        "offer",
+        "offered",
+    }
+)
+# END CODE REFERENCED FROM https://www.aprendeinglesenleganes.com/resources/DITRANSITIVE%20VERBS%20(LIST)%20.pdf
+
+
+def _is_hyphenated_number(word: str) -> bool:
+    """Check if word is a hyphenated number like twenty-one or thirty-two."""
+    # Most tokens have no hyphen; reject them before any lowering or allocation.
+    if "-" not in word:
+        return False
+    head, _, tail = word.lower().partition("-")
+    return head in _NUM_WORDS and tail in _NUM_WORDS
+
+
+def _tokenize(text: str) -> list:
+    """Tokenize the sentence returning a list of the tokens.
+
+    Args:
+        text: The text to be tokenized.
+
+    References:
+        - Ch.2 Words and Tokens:
+            https://web.stanford.edu/~jurafsky/slp3/2.pdf
+        - Tokenization in NLP:
+            https://www.datacamp.com/blog/what-is-tokenization
+    """
+    # Interned tokens share storage across calls and hit the cached hash in set lookups.
+    return list(map(sys.intern, text.translate(_PUNCT_TABLE).rstrip(".").split()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_pos(word: str, prev_lower: str = None, next_lower: str = None) -> str:
+    """Get part-of-speech tag for a word, memoized on the word and its neighbours.
+
+    The word keeps its original case because capitalization marks proper nouns;
+    the neighbours only feed lexicon and set lookups, so callers lower them once
+    up front and the cache key is already normalized.
+
+    Args:
+        word: The given word that needs to be tagged.
+        prev_lower: The lower-cased previous word in the sentence.
+        next_lower: The lower-cased next word in the sentence.
+
+    References:
+        - Part of Speech Tagging:
+            https://campus.datacamp.com/courses/feature-engineering-for-nlp-in-python/text-preprocessing-pos-tagging-and-ner?ex=8
+        - Penn Treebank POS Tags:
+            https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
+        - Ch.17 Sequence Labeling for POS and Named Entities:
+            https://web.stanford.edu/~jurafsky/slp3/17.pdf
+    """
+    word_lower = word.lower()
+    # handle ambigour 'to' position.
+    if word_lower == "to":
+        if next_lower:
+            if next_lower in _VERBS:
+                return "PART"
+            else:
+                return "ADP"
+        return "ADP"
+
+    first = word[:1]  # slice so an empty word falls through to the NOUN default
+    if first.isupper():
+        # Fast path for capitalized words: no clock time starts with a letter, so only the
+        # time-word and name probes can precede the proper-noun answer.
+        if word_lower in _TIME_WORDS:
+            return "TIME"
+        # Known names, and capitalized mid-sentence words as the are likely proper noun
+        if word_lower in _NAMES or prev_lower is not None:
+            return "PROPN"
+    elif (first.isdigit() and _TIME_PATTERN.fullmatch(word)) or word_lower in _TIME_WORDS:
+        return "TIME"
+
+    # Check known words first
+    elif word_lower in _NAMES:
+        return "PROPN"
+
+    # Probe the lexicon once; the context and lexicon rules below both reuse the result.
+    pos = _POS.get(word_lower, _UNK)
+
+    # Infer from context: article/adjective usually precedes noun
+    if prev_lower and prev_lower in _DETERMINERS:
+        if pos is _UNK or pos == "VERB":
+            return "NOUN"  # "a play" → NOUN
+        return pos  # "the best" → stays ADJ
+
+    elif pos is not _UNK:
+        return pos
+
+    elif _is_hyphenated_number(word_lower):
+        return "NUM"
+
+    # Infer from morphology (suffix patterns)
+    node = _SUFFIX_TRIE
+    for ch in reversed(word_lower):
+        node = node.get(ch)
+        if node is None:
+            break
+        rule = node.get("")
+        if rule is not None:
+            pos, min_length = rule
+            if len(word_lower) >= min_length:
+                return pos
+            break
+
+    return "NOUN"  # Default guess: noun (most common for unknowns)
+
+
+@functools.lru_cache(maxsize=2048)
+def _lemma(word: str) -> str:
+    """Get the lemma (base form) of a word, falling back to the lower-cased word.
+
+    Args:
+        word: The given word to lemmatize.
+    """
+    word_lower = word.lower()
+    return _LEMMA.get(word_lower, word_lower)
+
+
+def _tag_tokens(tokens: list[str]) -> list[tuple[str, str, str]]:
+    """Tag all tokens with POS and return the list of (token, lower-cased token, POS) tuples.
+    Args:
+        tokens: The list of words that make up the sentence.
+    """
+    if len(tokens) < 2:
+        return []
+    # Pair each token with its neighbours in one zip instead of indexing per token,
+    # lowering every token once rather than once per neighbouring position.
+    lowered = [sys.intern(token.lower()) for token in tokens]
+    prev_tokens = [None, *lowered[:-1]]
+    next_tokens = [*lowered[1:], None]
+    return [
+        (token, token_lower, _get_pos(token, prev_lower, next_lower))
+        for token, token_lower, prev_lower, next_lower in zip(
+            tokens, lowered, prev_tokens, next_tokens, strict=True
+        )
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _tag(sentence: str) -> tuple[tuple[str, str, str], ...]:
+    """Tokenize and POS-tag a sentence, memoized on the sentence text.
+
+    The result is an immutable tuple so it can be shared safely between calls;
+    repeated sentences skip tokenization and tagging entirely.
+
+    Args:
+        sentence: The sentence to tag.
+    """
+    return tuple(_tag_tokens(_tokenize(sentence)))
+
+
+@functools.lru_cache(maxsize=1024)
+def _question_tokens(question: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Lower and tokenize a question, memoized on the question text.
+
+    Returns the ordered tokens for classification and their set for membership tests.
+
+    Args:
+        question: The question to tokenize.
+    """
+    tokens = tuple(_tokenize(question.lower()))
+    return tokens, frozenset(tokens)
 
 
 class SentenceReadingAgent:
@@ -43,704 +1008,24 @@ class SentenceReadingAgent:
     5. Frame querying - Jurafsky & Martin (2009), Ch. 23
     """
 
+    # Read-only lexicon and word classes, built once at import and shared by every agent.
+    WORD_DATA = MappingProxyType(_WORD_DATA)
+    NAMES = _NAMES
+    DIST = _DIST
+    TIME_PATTERN = _TIME_PATTERN
+    TIME_MARKERS = _TIME_MARKERS
+    TIME_WORDS = _TIME_WORDS
+    CLAUSE_MARKERS = _CLAUSE_MARKERS
+    W_MOVEMENT = _W_MOVEMENT
+    DIRECTIONS = _DIRECTIONS
+    NUM_WORDS = _NUM_WORDS
+    QUANTS = _QUANTS
+    SUB_PRONOUNS = _SUB_PRONOUNS
+    OBJ_PRONOUNS = _OBJ_PRONOUNS
+    DITRANSITIVE = _DITRANSITIVE
+
     def __init__(self):
-        # POS (Part of Speech): tells you if a word is a NOUN, VERB, ADJ, etc.
-        # Lemma: base form of the word ("brought" → "bring")
-        self.WORD_DATA = {
-            "Serena": {"pos": "PROPN", "lemma": "serena"},
-            "Andrew": {"pos": "PROPN", "lemma": "andrew"},
-            "Bobbie": {"pos": "PROPN", "lemma": "bobbie"},
-            "Cason": {"pos": "PROPN", "lemma": "cason"},
-            "David": {"pos": "PROPN", "lemma": "david"},
-            "Farzana": {"pos": "PROPN", "lemma": "farzana"},
-            "Frank": {"pos": "PROPN", "lemma": "frank"},
-            "Hannah": {"pos": "PROPN", "lemma": "hannah"},
-            "Ida": {"pos": "PROPN", "lemma": "ida"},
-            "Irene": {"pos": "PROPN", "lemma": "irene"},
-            "Jim": {"pos": "PROPN", "lemma": "jim"},
-            "Jose": {"pos": "PROPN", "lemma": "jose"},
-            "Keith": {"pos": "PROPN", "lemma": "keith"},
-            "Laura": {"pos": "PROPN", "lemma": "laura"},
-            "Lucy": {"pos": "PROPN", "lemma": "lucy"},
-            "Meredith": {"pos": "PROPN", "lemma": "meredith"},
-            "Nick": {"pos": "PROPN", "lemma": "nick"},
-            "Ada": {"pos": "PROPN", "lemma": "ada"},
-            "Yeeling": {"pos": "PROPN", "lemma": "yeeling"},
-            "Yan": {"pos": "PROPN", "lemma": "yan"},
-            "the": {"pos": "PRON", "lemma": "the"},
-            "of": {"pos": "ADP", "lemma": "of"},
-            "to": {"pos": "PART", "lemma": "to"},
-            "and": {"pos": "CCONJ", "lemma": "and"},
-            "a": {"pos": "PRON", "lemma": "a"},
-            "in": {"pos": "ADP", "lemma": "in"},
-            "is": {"pos": "AUX", "lemma": "be"},
-            "it": {"pos": "PRON", "lemma": "it"},
-            "you": {"pos": "PRON", "lemma": "you"},
-            "that": {"pos": "SCONJ", "lemma": "that"},
-            "he": {"pos": "PRON", "lemma": "he"},
-            "was": {"pos": "AUX", "lemma": "be"},
-            "for": {"pos": "ADP", "lemma": "for"},
-            "on": {"pos": "ADP", "lemma": "on"},
-            "are": {"pos": "AUX", "lemma": "be"},
-            "with": {"pos": "ADP", "lemma": "with"},
-            "as": {"pos": "ADP", "lemma": "as"},
-            "I": {"pos": "PRON", "lemma": "I"},
-            "his": {"pos": "PRON", "lemma": "his"},
-            "they": {"pos": "PRON", "lemma": "they"},
-            "be": {"pos": "AUX", "lemma": "be"},
-            "at": {"pos": "ADP", "lemma": "at"},
-            "one": {"pos": "NUM", "lemma": "one"},
-            "have": {"pos": "VERB", "lemma": "have"},
-            "this": {"pos": "PRON", "lemma": "this"},
-            "from": {"pos": "ADP", "lemma": "from"},
-            "or": {"pos": "CCONJ", "lemma": "or"},
-            "had": {"pos": "VERB", "lemma": "have"},
-            "by": {"pos": "ADP", "lemma": "by"},
-            "hot": {"pos": "ADJ", "lemma": "hot"},
-            "but": {"pos": "CCONJ", "lemma": "but"},
-            "some": {"pos": "PRON", "lemma": "some"},
-            "what": {"pos": "PRON", "lemma": "what"},
-            "there": {"pos": "PRON", "lemma": "there"},
-            "we": {"pos": "PRON", "lemma": "we"},
-            "can": {"pos": "AUX", "lemma": "can"},
-            "out": {"pos": "ADV", "lemma": "out"},
-            "other": {"pos": "ADJ", "lemma": "other"},
-            "were": {"pos": "AUX", "lemma": "be"},
-            "all": {"pos": "PRON", "lemma": "all"},
-            "your": {"pos": "PRON", "lemma": "your"},
-            "when": {"pos": "SCONJ", "lemma": "when"},
-            "up": {"pos": "ADV", "lemma": "up"},
-            "use": {"pos": "NOUN", "lemma": "use"},
-            "word": {"pos": "NOUN", "lemma": "word"},
-            "how": {"pos": "SCONJ", "lemma": "how"},
-            "said": {"pos": "VERB", "lemma": "say"},
-            "an": {"pos": "PRON", "lemma": "an"},
-            "each": {"pos": "PRON", "lemma": "each"},
-            "she": {"pos": "PRON", "lemma": "she"},
-            "which": {"pos": "PRON", "lemma": "which"},
-            "do": {"pos": "VERB", "lemma": "do"},
-            "their": {"pos": "PRON", "lemma": "their"},
-            "time": {"pos": "NOUN", "lemma": "time"},
-            "if": {"pos": "SCONJ", "lemma": "if"},
-            "will": {"pos": "AUX", "lemma": "will"},
-            "way": {"pos": "NOUN", "lemma": "way"},
-            "about": {"pos": "ADV", "lemma": "about"},
-            "many": {"pos": "ADJ", "lemma": "many"},
-            "then": {"pos": "ADV", "lemma": "then"},
-            "them": {"pos": "PRON", "lemma": "they"},
-            "would": {"pos": "AUX", "lemma": "would"},
-            "write": {"pos": "VERB", "lemma": "write"},
-            "wrote": {"pos": "VERB", "lemma": "write"},
-            "like": {"pos": "INTJ", "lemma": "like"},
-            "so": {"pos": "ADV", "lemma": "so"},
-            "these": {"pos": "PRON", "lemma": "these"},
-            "her": {"pos": "PRON", "lemma": "she"},
-            "long": {"pos": "ADJ", "lemma": "long"},
-            "make": {"pos": "VERB", "lemma": "make"},
-            "thing": {"pos": "NOUN", "lemma": "thing"},
-            "see": {"pos": "VERB", "lemma": "see"},
-            "him": {"pos": "PRON", "lemma": "he"},
-            "two": {"pos": "NUM", "lemma": "two"},
-            "has": {"pos": "VERB", "lemma": "have"},
-            "look": {"pos": "VERB", "lemma": "look"},
-            "more": {"pos": "ADV", "lemma": "more"},
-            "day": {"pos": "NOUN", "lemma": "day"},
-            "could": {"pos": "AUX", "lemma": "could"},
-            "go": {"pos": "VERB", "lemma": "go"},
-            "come": {"pos": "VERB", "lemma": "come"},
-            "did": {"pos": "VERB", "lemma": "do"},
-            "my": {"pos": "PRON", "lemma": "my"},
-            "sound": {"pos": "VERB", "lemma": "sound"},
-            "no": {"pos": "INTJ", "lemma": "no"},
-            "most": {"pos": "ADV", "lemma": "most"},
-            "number": {"pos": "NOUN", "lemma": "number"},
-            "who": {"pos": "PRON", "lemma": "who"},
-            "over": {"pos": "ADV", "lemma": "over"},
-            "know": {"pos": "VERB", "lemma": "know"},
-            "water": {"pos": "NOUN", "lemma": "water"},
-            "than": {"pos": "ADP", "lemma": "than"},
-            "call": {"pos": "VERB", "lemma": "call"},
-            "first": {"pos": "ADV", "lemma": "first"},
-            "people": {"pos": "NOUN", "lemma": "people"},
-            "may": {"pos": "AUX", "lemma": "may"},
-            "down": {"pos": "ADV", "lemma": "down"},
-            "side": {"pos": "NOUN", "lemma": "side"},
-            "been": {"pos": "AUX", "lemma": "be"},
-            "now": {"pos": "ADV", "lemma": "now"},
-            "find": {"pos": "VERB", "lemma": "find"},
-            "any": {"pos": "PRON", "lemma": "any"},
-            "new": {"pos": "ADJ", "lemma": "new"},
-            "work": {"pos": "VERB", "lemma": "work"},
-            "part": {"pos": "NOUN", "lemma": "part"},
-            "take": {"pos": "VERB", "lemma": "take"},
-            "get": {"pos": "VERB", "lemma": "get"},
-            "place": {"pos": "NOUN", "lemma": "place"},
-            "made": {"pos": "VERB", "lemma": "make"},
-            "live": {"pos": "ADJ", "lemma": "live"},
-            "where": {"pos": "SCONJ", "lemma": "where"},
-            "after": {"pos": "ADP", "lemma": "after"},
-            "back": {"pos": "ADV", "lemma": "back"},
-            "little": {"pos": "ADJ", "lemma": "little"},
-            "only": {"pos": "ADV", "lemma": "only"},
-            "round": {"pos": "ADJ", "lemma": "round"},
-            "man": {"pos": "NOUN", "lemma": "man"},
-            "year": {"pos": "NOUN", "lemma": "year"},
-            "came": {"pos": "VERB", "lemma": "come"},
-            "show": {"pos": "VERB", "lemma": "show"},
-            "every": {"pos": "DET", "lemma": "every"},
-            "good": {"pos": "ADJ", "lemma": "good"},
-            "me": {"pos": "PRON", "lemma": "I"},
-            "give": {"pos": "VERB", "lemma": "give"},
-            "our": {"pos": "PRON", "lemma": "our"},
-            "under": {"pos": "ADP", "lemma": "under"},
-            "name": {"pos": "NOUN", "lemma": "name"},
-            "very": {"pos": "ADV", "lemma": "very"},
-            "through": {"pos": "ADP", "lemma": "through"},
-            "just": {"pos": "ADV", "lemma": "just"},
-            "form": {"pos": "NOUN", "lemma": "form"},
-            "much": {"pos": "ADJ", "lemma": "much"},
-            "great": {"pos": "ADJ", "lemma": "great"},
-            "think": {"pos": "VERB", "lemma": "think"},
-            "say": {"pos": "VERB", "lemma": "say"},
-            "help": {"pos": "VERB", "lemma": "help"},
-            "low": {"pos": "ADJ", "lemma": "low"},
-            "line": {"pos": "NOUN", "lemma": "line"},
-            "before": {"pos": "ADP", "lemma": "before"},
-            "turn": {"pos": "VERB", "lemma": "turn"},
-            "cause": {"pos": "VERB", "lemma": "cause"},
-            "same": {"pos": "ADJ", "lemma": "same"},
-            "mean": {"pos": "VERB", "lemma": "mean"},
-            "differ": {"pos": "VERB", "lemma": "differ"},
-            "move": {"pos": "VERB", "lemma": "move"},
-            "right": {"pos": "INTJ", "lemma": "right"},
-            "boy": {"pos": "NOUN", "lemma": "boy"},
-            "old": {"pos": "ADJ", "lemma": "old"},
-            "too": {"pos": "ADV", "lemma": "too"},
-            "does": {"pos": "VERB", "lemma": "do"},
-            "tell": {"pos": "VERB", "lemma": "tell"},
-            "sentence": {"pos": "NOUN", "lemma": "sentence"},
-            "set": {"pos": "VERB", "lemma": "set"},
-            "three": {"pos": "NUM", "lemma": "three"},
-            "want": {"pos": "VERB", "lemma": "want"},
-            "air": {"pos": "NOUN", "lemma": "air"},
-            "well": {"pos": "ADV", "lemma": "well"},
-            "also": {"pos": "ADV", "lemma": "also"},
-            "play": {"pos": "VERB", "lemma": "play"},
-            "small": {"pos": "ADJ", "lemma": "small"},
-            "end": {"pos": "NOUN", "lemma": "end"},
-            "put": {"pos": "VERB", "lemma": "put"},
-            "home": {"pos": "NOUN", "lemma": "home"},
-            "read": {"pos": "VERB", "lemma": "read"},
-            "hand": {"pos": "NOUN", "lemma": "hand"},
-            "port": {"pos": "NOUN", "lemma": "port"},
-            "large": {"pos": "ADJ", "lemma": "large"},
-            "spell": {"pos": "VERB", "lemma": "spell"},
-            "add": {"pos": "VERB", "lemma": "add"},
-            "even": {"pos": "ADV", "lemma": "even"},
-            "land": {"pos": "NOUN", "lemma": "land"},
-            "here": {"pos": "ADV", "lemma": "here"},
-            "must": {"pos": "AUX", "lemma": "must"},
-            "big": {"pos": "ADJ", "lemma": "big"},
-            "high": {"pos": "ADJ", "lemma": "high"},
-            "such": {"pos": "ADJ", "lemma": "such"},
-            "follow": {"pos": "VERB", "lemma": "follow"},
-            "act": {"pos": "NOUN", "lemma": "act"},
-            "why": {"pos": "SCONJ", "lemma": "why"},
-            "ask": {"pos": "VERB", "lemma": "ask"},
-            "men": {"pos": "NOUN", "lemma": "man"},
-            "change": {"pos": "VERB", "lemma": "change"},
-            "went": {"pos": "VERB", "lemma": "go"},
-            "light": {"pos": "NOUN", "lemma": "light"},
-            "kind": {"pos": "ADV", "lemma": "kind"},
-            "off": {"pos": "ADP", "lemma": "off"},
-            "need": {"pos": "VERB", "lemma": "need"},
-            "house": {"pos": "PROPN", "lemma": "house"},
-            "picture": {"pos": "NOUN", "lemma": "picture"},
-            "try": {"pos": "VERB", "lemma": "try"},
-            "us": {"pos": "PRON", "lemma": "we"},
-            "again": {"pos": "ADV", "lemma": "again"},
-            "animal": {"pos": "NOUN", "lemma": "animal"},
-            "point": {"pos": "NOUN", "lemma": "point"},
-            "mother": {"pos": "NOUN", "lemma": "mother"},
-            "world": {"pos": "NOUN", "lemma": "world"},
-            "near": {"pos": "ADP", "lemma": "near"},
-            "build": {"pos": "VERB", "lemma": "build"},
-            "self": {"pos": "NOUN", "lemma": "self"},
-            "earth": {"pos": "NOUN", "lemma": "earth"},
-            "father": {"pos": "PROPN", "lemma": "father"},
-            "head": {"pos": "NOUN", "lemma": "head"},
-            "stand": {"pos": "VERB", "lemma": "stand"},
-            "own": {"pos": "ADJ", "lemma": "own"},
-            "page": {"pos": "NOUN", "lemma": "page"},
-            "should": {"pos": "AUX", "lemma": "should"},
-            "country": {"pos": "NOUN", "lemma": "country"},
-            "found": {"pos": "VERB", "lemma": "find"},
-            "answer": {"pos": "VERB", "lemma": "answer"},
-            "school": {"pos": "NOUN", "lemma": "school"},
-            "grow": {"pos": "VERB", "lemma": "grow"},
-            "study": {"pos": "NOUN", "lemma": "study"},
-            "still": {"pos": "ADV", "lemma": "still"},
-            "learn": {"pos": "VERB", "lemma": "learn"},
-            "plant": {"pos": "NOUN", "lemma": "plant"},
-            "cover": {"pos": "VERB", "lemma": "cover"},
-            "food": {"pos": "NOUN", "lemma": "food"},
-            "sun": {"pos": "PROPN", "lemma": "sun"},
-            "four": {"pos": "NUM", "lemma": "four"},
-            "thought": {"pos": "VERB", "lemma": "think"},
-            "let": {"pos": "VERB", "lemma": "let"},
-            "keep": {"pos": "VERB", "lemma": "keep"},
-            "eye": {"pos": "NOUN", "lemma": "eye"},
-            "never": {"pos": "ADV", "lemma": "never"},
-            "last": {"pos": "ADJ", "lemma": "last"},
-            "door": {"pos": "NOUN", "lemma": "door"},
-            "between": {"pos": "ADP", "lemma": "between"},
-            "city": {"pos": "NOUN", "lemma": "city"},
-            "tree": {"pos": "NOUN", "lemma": "tree"},
-            "cross": {"pos": "VERB", "lemma": "cross"},
-            "since": {"pos": "SCONJ", "lemma": "since"},
-            "hard": {"pos": "ADJ", "lemma": "hard"},
-            "start": {"pos": "VERB", "lemma": "start"},
-            "might": {"pos": "AUX", "lemma": "might"},
-            "story": {"pos": "NOUN", "lemma": "story"},
-            "saw": {"pos": "VERB", "lemma": "see"},
-            "far": {"pos": "ADV", "lemma": "far"},
-            "sea": {"pos": "NOUN", "lemma": "sea"},
-            "draw": {"pos": "VERB", "lemma": "draw"},
-            "left": {"pos": "VERB", "lemma": "leave"},
-            "late": {"pos": "ADV", "lemma": "late"},
-            "run": {"pos": "VERB", "lemma": "run"},
-            "don't": {"pos": "PART", "lemma": "not"},
-            "while": {"pos": "SCONJ", "lemma": "while"},
-            "press": {"pos": "NOUN", "lemma": "press"},
-            "close": {"pos": "ADV", "lemma": "close"},
-            "night": {"pos": "NOUN", "lemma": "night"},
-            "real": {"pos": "ADJ", "lemma": "real"},
-            "life": {"pos": "NOUN", "lemma": "life"},
-            "few": {"pos": "ADJ", "lemma": "few"},
-            "stop": {"pos": "VERB", "lemma": "stop"},
-            "open": {"pos": "ADJ", "lemma": "open"},
-            "seem": {"pos": "VERB", "lemma": "seem"},
-            "together": {"pos": "ADV", "lemma": "together"},
-            "next": {"pos": "ADJ", "lemma": "next"},
-            "white": {"pos": "ADJ", "lemma": "white"},
-            "children": {"pos": "NOUN", "lemma": "child"},
-            "begin": {"pos": "VERB", "lemma": "begin"},
-            "got": {"pos": "VERB", "lemma": "get"},
-            "walk": {"pos": "VERB", "lemma": "walk"},
-            "example": {"pos": "NOUN", "lemma": "example"},
-            "ease": {"pos": "NOUN", "lemma": "ease"},
-            "paper": {"pos": "NOUN", "lemma": "paper"},
-            "often": {"pos": "ADV", "lemma": "often"},
-            "always": {"pos": "ADV", "lemma": "always"},
-            "music": {"pos": "NOUN", "lemma": "music"},
-            "those": {"pos": "PRON", "lemma": "those"},
-            "both": {"pos": "PRON", "lemma": "both"},
-            "mark": {"pos": "PROPN", "lemma": "mark"},
-            "book": {"pos": "PROPN", "lemma": "book"},
-            "letter": {"pos": "NOUN", "lemma": "letter"},
-            "until": {"pos": "ADP", "lemma": "until"},
-            "mile": {"pos": "NOUN", "lemma": "mile"},
-            "river": {"pos": "NOUN", "lemma": "river"},
-            "car": {"pos": "NOUN", "lemma": "car"},
-            "feet": {"pos": "NOUN", "lemma": "foot"},
-            "care": {"pos": "VERB", "lemma": "care"},
-            "second": {"pos": "ADJ", "lemma": "second"},
-            "group": {"pos": "NOUN", "lemma": "group"},
-            "carry": {"pos": "VERB", "lemma": "carry"},
-            "took": {"pos": "VERB", "lemma": "take"},
-            "rain": {"pos": "NOUN", "lemma": "rain"},
-            "eat": {"pos": "VERB", "lemma": "eat"},
-            "room": {"pos": "NOUN", "lemma": "room"},
-            "friend": {"pos": "NOUN", "lemma": "friend"},
-            "began": {"pos": "VERB", "lemma": "begin"},
-            "idea": {"pos": "NOUN", "lemma": "idea"},
-            "fish": {"pos": "NOUN", "lemma": "fish"},
-            "mountain": {"pos": "NOUN", "lemma": "mountain"},
-            "north": {"pos": "NOUN", "lemma": "north"},
-            "once": {"pos": "ADV", "lemma": "once"},
-            "base": {"pos": "NOUN", "lemma": "base"},
-            "hear": {"pos": "VERB", "lemma": "hear"},
-            "horse": {"pos": "NOUN", "lemma": "horse"},
-            "cut": {"pos": "VERB", "lemma": "cut"},
-            "sure": {"pos": "ADJ", "lemma": "sure"},
-            "watch": {"pos": "VERB", "lemma": "watch"},
-            "color": {"pos": "NOUN", "lemma": "color"},
-            "face": {"pos": "VERB", "lemma": "face"},
-            "wood": {"pos": "NOUN", "lemma": "wood"},
-            "main": {"pos": "ADJ", "lemma": "main"},
-            "enough": {"pos": "ADV", "lemma": "enough"},
-            "plain": {"pos": "ADV", "lemma": "plain"},
-            "girl": {"pos": "NOUN", "lemma": "girl"},
-            "usual": {"pos": "ADJ", "lemma": "usual"},
-            "young": {"pos": "ADJ", "lemma": "young"},
-            "ready": {"pos": "ADJ", "lemma": "ready"},
-            "above": {"pos": "ADV", "lemma": "above"},
-            "ever": {"pos": "ADV", "lemma": "ever"},
-            "red": {"pos": "ADJ", "lemma": "red"},
-            "Red": {"pos": "ADJ", "lemma": "red"},
-            "list": {"pos": "NOUN", "lemma": "list"},
-            "though": {"pos": "SCONJ", "lemma": "though"},
-            "feel": {"pos": "VERB", "lemma": "feel"},
-            "talk": {"pos": "VERB", "lemma": "talk"},
-            "bird": {"pos": "NOUN", "lemma": "bird"},
-            "soon": {"pos": "ADV", "lemma": "soon"},
-            "body": {"pos": "NOUN", "lemma": "body"},
-            "dog": {"pos": "NOUN", "lemma": "dog"},
-            "dogs": {"pos": "NOUN", "lemma": "dog"},
-            "dog's": {"pos": "PART", "lemma": "'s"},
-            "family": {"pos": "NOUN", "lemma": "family"},
-            "direct": {"pos": "ADJ", "lemma": "direct"},
-            "pose": {"pos": "VERB", "lemma": "pose"},
-            "leave": {"pos": "VERB", "lemma": "leave"},
-            "song": {"pos": "NOUN", "lemma": "song"},
-            "measure": {"pos": "NOUN", "lemma": "measure"},
-            "state": {"pos": "NOUN", "lemma": "state"},
-            "product": {"pos": "NOUN", "lemma": "product"},
-            "black": {"pos": "ADJ", "lemma": "black"},
-            "short": {"pos": "ADJ", "lemma": "short"},
-            "numeral": {"pos": "ADJ", "lemma": "numeral"},
-            "class": {"pos": "NOUN", "lemma": "class"},
-            "wind": {"pos": "NOUN", "lemma": "wind"},
-            "question": {"pos": "NOUN", "lemma": "question"},
-            "happen": {"pos": "VERB", "lemma": "happen"},
-            "complete": {"pos": "ADJ", "lemma": "complete"},
-            "ship": {"pos": "NOUN", "lemma": "ship"},
-            "area": {"pos": "NOUN", "lemma": "area"},
-            "half": {"pos": "ADJ", "lemma": "half"},
-            "rock": {"pos": "NOUN", "lemma": "rock"},
-            "order": {"pos": "NOUN", "lemma": "order"},
-            "fire": {"pos": "NOUN", "lemma": "fire"},
-            "south": {"pos": "ADJ", "lemma": "south"},
-            "problem": {"pos": "NOUN", "lemma": "problem"},
-            "piece": {"pos": "NOUN", "lemma": "piece"},
-            "told": {"pos": "VERB", "lemma": "tell"},
-            "knew": {"pos": "VERB", "lemma": "know"},
-            "pass": {"pos": "VERB", "lemma": "pass"},
-            "farm": {"pos": "NOUN", "lemma": "farm"},
-            "top": {"pos": "ADJ", "lemma": "top"},
-            "whole": {"pos": "ADJ", "lemma": "whole"},
-            "king": {"pos": "NOUN", "lemma": "king"},
-            "size": {"pos": "NOUN", "lemma": "size"},
-            "heard": {"pos": "VERB", "lemma": "hear"},
-            "best": {"pos": "ADJ", "lemma": "well"},
-            "hour": {"pos": "NOUN", "lemma": "hour"},
-            "better": {"pos": "ADV", "lemma": "well"},
-            "true": {"pos": "ADJ", "lemma": "true"},
-            "during": {"pos": "ADP", "lemma": "during"},
-            "hundred": {"pos": "NUM", "lemma": "hundred"},
-            "am": {"pos": "AUX", "lemma": "be"},
-            "remember": {"pos": "VERB", "lemma": "remember"},
-            "step": {"pos": "VERB", "lemma": "step"},
-            "early": {"pos": "ADV", "lemma": "early"},
-            "hold": {"pos": "VERB", "lemma": "hold"},
-            "west": {"pos": "PROPN", "lemma": "west"},
-            "ground": {"pos": "NOUN", "lemma": "ground"},
-            "interest": {"pos": "NOUN", "lemma": "interest"},
-            "reach": {"pos": "VERB", "lemma": "reach"},
-            "fast": {"pos": "ADJ", "lemma": "fast"},
-            "five": {"pos": "NUM", "lemma": "five"},
-            "sing": {"pos": "VERB", "lemma": "sing"},
-            "sings": {"pos": "VERB", "lemma": "sing"},
-            "listen": {"pos": "VERB", "lemma": "listen"},
-            "six": {"pos": "NUM", "lemma": "six"},
-            "table": {"pos": "NOUN", "lemma": "table"},
-            "travel": {"pos": "NOUN", "lemma": "travel"},
-            "less": {"pos": "ADV", "lemma": "less"},
-            "morning": {"pos": "NOUN", "lemma": "morning"},
-            "ten": {"pos": "NUM", "lemma": "ten"},
-            "simple": {"pos": "ADJ", "lemma": "simple"},
-            "several": {"pos": "ADJ", "lemma": "several"},
-            "vowel": {"pos": "NOUN", "lemma": "vowel"},
-            "toward": {"pos": "ADP", "lemma": "toward"},
-            "war": {"pos": "NOUN", "lemma": "war"},
-            "lay": {"pos": "VERB", "lemma": "lie"},
-            "against": {"pos": "ADP", "lemma": "against"},
-            "pattern": {"pos": "NOUN", "lemma": "pattern"},
-            "slow": {"pos": "ADJ", "lemma": "slow"},
-            "center": {"pos": "PROPN", "lemma": "center"},
-            "love": {"pos": "NOUN", "lemma": "love"},
-            "person": {"pos": "NOUN", "lemma": "person"},
-            "money": {"pos": "NOUN", "lemma": "money"},
-            "serve": {"pos": "VERB", "lemma": "serve"},
-            "appear": {"pos": "VERB", "lemma": "appear"},
-            "road": {"pos": "NOUN", "lemma": "road"},
-            "map": {"pos": "NOUN", "lemma": "map"},
-            "science": {"pos": "NOUN", "lemma": "science"},
-            "rule": {"pos": "NOUN", "lemma": "rule"},
-            "govern": {"pos": "VERB", "lemma": "govern"},
-            "pull": {"pos": "VERB", "lemma": "pull"},
-            "cold": {"pos": "ADJ", "lemma": "cold"},
-            "notice": {"pos": "VERB", "lemma": "notice"},
-            "voice": {"pos": "NOUN", "lemma": "voice"},
-            "fall": {"pos": "NOUN", "lemma": "fall"},
-            "power": {"pos": "NOUN", "lemma": "power"},
-            "town": {"pos": "NOUN", "lemma": "town"},
-            "fine": {"pos": "ADJ", "lemma": "fine"},
-            "certain": {"pos": "ADJ", "lemma": "certain"},
-            "fly": {"pos": "VERB", "lemma": "fly"},
-            "unit": {"pos": "NOUN", "lemma": "unit"},
-            "lead": {"pos": "VERB", "lemma": "lead"},
-            "cry": {"pos": "VERB", "lemma": "cry"},
-            "dark": {"pos": "ADJ", "lemma": "dark"},
-            "machine": {"pos": "NOUN", "lemma": "machine"},
-            "note": {"pos": "NOUN", "lemma": "note"},
-            "wait": {"pos": "VERB", "lemma": "wait"},
-            "plan": {"pos": "NOUN", "lemma": "plan"},
-            "figure": {"pos": "NOUN", "lemma": "figure"},
-            "star": {"pos": "PROPN", "lemma": "star"},
-            "box": {"pos": "PROPN", "lemma": "box"},
-            "noun": {"pos": "PROPN", "lemma": "noun"},
-            "field": {"pos": "NOUN", "lemma": "field"},
-            "rest": {"pos": "VERB", "lemma": "rest"},
-            "correct": {"pos": "ADJ", "lemma": "correct"},
-            "able": {"pos": "ADJ", "lemma": "able"},
-            "pound": {"pos": "NOUN", "lemma": "pound"},
-            "done": {"pos": "VERB", "lemma": "do"},
-            "beauty": {"pos": "NOUN", "lemma": "beauty"},
-            "drive": {"pos": "VERB", "lemma": "drive"},
-            "stood": {"pos": "VERB", "lemma": "stand"},
-            "contain": {"pos": "VERB", "lemma": "contain"},
-            "front": {"pos": "NOUN", "lemma": "front"},
-            "teach": {"pos": "VERB", "lemma": "teach"},
-            "week": {"pos": "NOUN", "lemma": "week"},
-            "final": {"pos": "ADJ", "lemma": "final"},
-            "gave": {"pos": "VERB", "lemma": "give"},
-            "green": {"pos": "ADJ", "lemma": "green"},
-            "oh": {"pos": "INTJ", "lemma": "oh"},
-            "quick": {"pos": "ADJ", "lemma": "quick"},
-            "develop": {"pos": "VERB", "lemma": "develop"},
-            "sleep": {"pos": "NOUN", "lemma": "sleep"},
-            "warm": {"pos": "ADJ", "lemma": "warm"},
-            "free": {"pos": "ADJ", "lemma": "free"},
-            "minute": {"pos": "NOUN", "lemma": "minute"},
-            "strong": {"pos": "ADJ", "lemma": "strong"},
-            "special": {"pos": "ADJ", "lemma": "special"},
-            "mind": {"pos": "VERB", "lemma": "mind"},
-            "behind": {"pos": "ADV", "lemma": "behind"},
-            "clear": {"pos": "ADV", "lemma": "clear"},
-            "tail": {"pos": "NOUN", "lemma": "tail"},
-            "produce": {"pos": "VERB", "lemma": "produce"},
-            "fact": {"pos": "NOUN", "lemma": "fact"},
-            "street": {"pos": "NOUN", "lemma": "street"},
-            "inch": {"pos": "NOUN", "lemma": "inch"},
-            "lot": {"pos": "NOUN", "lemma": "lot"},
-            "nothing": {"pos": "PRON", "lemma": "nothing"},
-            "course": {"pos": "NOUN", "lemma": "course"},
-            "stay": {"pos": "VERB", "lemma": "stay"},
-            "wheel": {"pos": "NOUN", "lemma": "wheel"},
-            "full": {"pos": "ADJ", "lemma": "full"},
-            "force": {"pos": "NOUN", "lemma": "force"},
-            "blue": {"pos": "ADJ", "lemma": "blue"},
-            "object": {"pos": "VERB", "lemma": "object"},
-            "decide": {"pos": "VERB", "lemma": "decide"},
-            "surface": {"pos": "NOUN", "lemma": "surface"},
-            "deep": {"pos": "ADJ", "lemma": "deep"},
-            "moon": {"pos": "NOUN", "lemma": "moon"},
-            "island": {"pos": "NOUN", "lemma": "island"},
-            "foot": {"pos": "NOUN", "lemma": "foot"},
-            "yet": {"pos": "ADV", "lemma": "yet"},
-            "busy": {"pos": "ADJ", "lemma": "busy"},
-            "test": {"pos": "NOUN", "lemma": "test"},
-            "record": {"pos": "PROPN", "lemma": "record"},
-            "boat": {"pos": "NOUN", "lemma": "boat"},
-            "common": {"pos": "ADJ", "lemma": "common"},
-            "gold": {"pos": "ADJ", "lemma": "gold"},
-            "possible": {"pos": "ADJ", "lemma": "possible"},
-            "plane": {"pos": "NOUN", "lemma": "plane"},
-            "age": {"pos": "NOUN", "lemma": "age"},
-            "dry": {"pos": "ADJ", "lemma": "dry"},
-            "wonder": {"pos": "NOUN", "lemma": "wonder"},
-            "laugh": {"pos": "VERB", "lemma": "laugh"},
-            "thousand": {"pos": "NUM", "lemma": "thousand"},
-            "ago": {"pos": "ADV", "lemma": "ago"},
-            "ran": {"pos": "VERB", "lemma": "run"},
-            "check": {"pos": "VERB", "lemma": "check"},
-            "game": {"pos": "NOUN", "lemma": "game"},
-            "shape": {"pos": "NOUN", "lemma": "shape"},
-            "yes": {"pos": "INTJ", "lemma": "yes"},
-            "cool": {"pos": "ADJ", "lemma": "cool"},
-            "miss": {"pos": "VERB", "lemma": "miss"},
-            "brought": {"pos": "VERB", "lemma": "bring"},
-            "heat": {"pos": "NOUN", "lemma": "heat"},
-            "snow": {"pos": "NOUN", "lemma": "snow"},
-            "bed": {"pos": "NOUN", "lemma": "bed"},
-            "bring": {"pos": "VERB", "lemma": "bring"},
-            "sit": {"pos": "VERB", "lemma": "sit"},
-            "perhaps": {"pos": "ADV", "lemma": "perhaps"},
-            "fill": {"pos": "VERB", "lemma": "fill"},
-            "east": {"pos": "NOUN", "lemma": "east"},
-            "weight": {"pos": "NOUN", "lemma": "weight"},
-            "language": {"pos": "NOUN", "lemma": "language"},
-            "among": {"pos": "ADP", "lemma": "among"},
-            "adult": {"pos": "NOUN", "lemma": "adult"},
-            "adults": {"pos": "NOUN", "lemma": "adult"},
-            "yellow": {"pos": "ADJ", "lemma": "yellow"},
-            "orange": {"pos": "ADJ", "lemma": "orange"},
-            "purple": {"pos": "ADJ", "lemma": "purple"},
-            "brown": {"pos": "ADJ", "lemma": "brown"},
-            "pink": {"pos": "ADJ", "lemma": "pink"},
-            "gray": {"pos": "ADJ", "lemma": "gray"},
-            "grey": {"pos": "ADJ", "lemma": "grey"},
-            "silver": {"pos": "ADJ", "lemma": "silver"},
-            "tiny": {"pos": "ADJ", "lemma": "tiny"},
-            "huge": {"pos": "ADJ", "lemma": "huge"},
-            "tall": {"pos": "ADJ", "lemma": "tall"},
-            "wide": {"pos": "ADJ", "lemma": "wide"},
-            "narrow": {"pos": "ADJ", "lemma": "narrow"},
-            "thick": {"pos": "ADJ", "lemma": "thick"},
-            "thin": {"pos": "ADJ", "lemma": "thin"},
-            "ancient": {"pos": "ADJ", "lemma": "ancient"},
-            "modern": {"pos": "ADJ", "lemma": "modern"},
-            "fresh": {"pos": "ADJ", "lemma": "fresh"},
-        }
-        self.NAMES = {
-            "ada",
-            "andrew",
-            "bobbie",
-            "cason",
-            "david",
-            "farzana",
-            "frank",
-            "hannah",
-            "ida",
-            "irene",
-            "jim",
-            "jose",
-            "keith",
-            "laura",
-            "lucy",
-            "meredith",
-            "nick",
-            "serena",
-            "yan",
-            "yeeling",
-        }
-        self.DIST = {"mile", "foot", "feet", "meter", "kilometer", "inch", "yard"}
-        self.TIME_PATTERN = re.compile(r"\d{1,2}:\d{2}(AM|PM)?", re.IGNORECASE)
-        self.TIME_MARKERS = {"this", "last", "next", "every", "on"}
-        self.TIME_WORDS = {
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
-            "january",
-            "february",
-            "march",
-            "april",
-            "may",
-            "june",
-            "july",
-            "august",
-            "september",
-            "october",
-            "november",
-            "december",
-            "today",
-            "tomorrow",
-            "yesterday",
-            "now",
-            "soon",
-            "later",
-            "recently",
-            "morning",
-            "afternoon",
-            "evening",
-            "night",
-            "noon",
-            "midnight",
-            "spring",
-            "summer",
-            "fall",
-            "autumn",
-            "winter",
-            "week",
-            "month",
-            "year",
-            "day",
-            "hour",
-            "minute",
-            "second",
-        }
-        self.CLAUSE_MARKERS = {"when", "while", "if", "because", "although", "unless"}
-        self.W_MOVEMENT = {"get", "go", "travel", "arrive", "walk", "drive", "come"}
-        self.DIRECTIONS = {"east", "west", "north", "south"}
-        self.NUM_WORDS = {
-            "one",
-            "two",
-            "three",
-            "four",
-            "five",
-            "six",
-            "seven",
-            "eight",
-            "nine",
-            "ten",
-            "eleven",
-            "twelve",
-            "thirteen",
-            "fourteen",
-            "fifteen",
-            "sixteen",
-            "seventeen",
-            "eighteen",
-            "nineteen",
-            "twenty",
-            "thirty",
-            "forty",
-            "fifty",
-            "sixty",
-            "seventy",
-            "eighty",
-            "ninety",
-            "hundred",
-            "thousand",
-            "million",
-            "billion",
-        }
-        self.QUANTS = {"all", "some", "every", "most", "few", "none"}
-        self.SUB_PRONOUNS = {"i", "he", "she", "we", "they"}
-        self.OBJ_PRONOUNS = {
-            "me",
-            "him",
-            "us",
-            "them",
-        }  # removed 'her' because it is also posessive :(
         self.frame = None
-        # BEGIN CODE REFERENCED FROM https://www.aprendeinglesenleganes.com/resources/DITRANSITIVE%20VERBS%20(LIST)%20.pdf
-        self.DITRANSITIVE = {
-            "give",
-            "gave",
-            "given",
-            "tell",
-            "told",
-            "show",
-            "showed",
-            "shown",
-            "send",
-            "sent",
-            "bring",
-            "brought",
-            "write",
-            "wrote",
-            "written",
-            "teach",
-            "taught",
-            "read",
-            "hand",
-            "handed",
-            "pass",
-            "passed",
-            "sell",
-            "sold",
-            "lend",
-            "lent",
-            "offer",
-            "offered",
-        }
-        # END CODE REFERENCED FROM https://www.aprendeinglesenleganes.com/resources/DITRANSITIVE%20VERBS%20(LIST)%20.pdf
 
     def _create_frame(self):
         """Creates the frame to analyze the sentence."""
@@ -758,28 +1043,25 @@ class SentenceReadingAgent:
             "distances": [],  # Measure phrases
             "quantities": [],  # numers like two dogs, three amigos, a doughnut, etc.
             "quantifiers": [],  # All, some, etc.
+            # Tail of each role list, stored once framing ends since most answers read it.
+            "last_agent": None,
+            "last_object": None,
+            "last_recipient": None,
+            "last_location": None,
+            "last_time": None,
         }
 
     def _is_hyphenated_number(self, word: str) -> bool:
         """Check if word is a hyphenated number like twenty-one or thirty-two."""
-        parts = word.lower().split("-")
-        return len(parts) == 2 and all(p in self.NUM_WORDS for p in parts)
+        return _is_hyphenated_number(word)
 
     def tokenize(self, text: str) -> list:
         """Tokenize the sentence returning a list of the tokens.
 
         Args:
             text: The text to be tokenized.
-
-        References:
-            - Ch.2 Words and Tokens:
-                https://web.stanford.edu/~jurafsky/slp3/2.pdf
-            - Tokenization in NLP:
-                https://www.datacamp.com/blog/what-is-tokenization
         """
-        text = text.rstrip(".?!")
-        tokens = text.split()
-        return tokens
+        return _tokenize(text)
 
     def get_pos(self, word: str, prev_word: str = None, next_word: str = None) -> str:
         """Get part-of-speech tag for a word.
@@ -788,92 +1070,44 @@ class SentenceReadingAgent:
             word: The given word that needs to be tagged.
             prev_word: The previous word in the sentence.
             next_word: The next word in the sentence.
-
-        References:
-            - Part of Speech Tagging:
-                https://campus.datacamp.com/courses/feature-engineering-for-nlp-in-python/text-preprocessing-pos-tagging-and-ner?ex=8
-            - Penn Treebank POS Tags:
-                https://www.ling.upenn.edu/courses/Fall_2003/ling001/penn_treebank_pos.html
-            - Ch.17 Sequence Labeling for POS and Named Entities:
-                https://web.stanford.edu/~jurafsky/slp3/17.pdf
         """
-        word_lower = word.lower()
-        # handle ambigour 'to' position.
-        if word_lower == "to":
-            if next_word:
-                next_data = self.WORD_DATA.get(next_word, None)
-                if next_data and next_data.get("pos") == "VERB":
-                    return "PART"
-                else:
-                    return "ADP"
-            return "ADP"
+        return _get_pos(
+            word,
+            prev_word.lower() if prev_word else prev_word,
+            next_word.lower() if next_word else next_word,
+        )
 
-        elif self.TIME_PATTERN.match(word) or word_lower in self.TIME_WORDS:
-            return "TIME"
+    def get_lemma(self, word: str) -> str:
+        """Get the lemma (base form) of a word, e.g. "brought" → "bring".
 
-        # Check known words first
-        elif word_lower in self.NAMES:
-            return "PROPN"
-        elif prev_word is not None and word[0].isupper():
-            # Capitalized mid-sentence words as the are likely proper noun
-            return "PROPN"
+        Args:
+            word: The given word to lemmatize.
+        """
+        return _lemma(word)
+
+    def tag_tokens(self, tokens: list[str]) -> list[tuple[str, str, str]]:
+        """Tag all tokens with POS and return the list of (token, lower-cased token, POS) tuples.
+        Args:
+            tokens: The list of words that make up the sentence.
+        """
+        return _tag_tokens(tokens)
 
-        # Infer from context: article/adjective usually precedes noun
-        elif prev_word and prev_word.lower() in {
-            "a",
-            "an",
-            "the",
-            "this",
-            "that",
-            "some",
-        }:
-            if word_lower in self.WORD_DATA:
-                pos = self.WORD_DATA[word_lower]["pos"]
-                if pos == "VERB":
-                    return "NOUN"  # "a play" → NOUN
-                return pos  # "the best" → stays ADJ
-            return "NOUN"
-
-        elif self._is_hyphenated_number(word_lower):
-            return "NUM"
-
-        elif word_lower in self.WORD_DATA:
-            return self.WORD_DATA[word_lower]["pos"]
-
-        # Infer from morphology (suffix patterns)
-        elif word_lower.endswith(("tion", "ness", "ment", "ity", "er", "or")):
-            return "NOUN"
-        elif word_lower.endswith(("ly",)):
-            return "ADV"
-        elif word_lower.endswith(("ed", "ing")) and len(word_lower) > 4:
-            return "VERB"
+    def tag_sentences(self, sentences: list[str]) -> list[tuple[tuple[str, str, str], ...]]:
+        """Tag a batch of sentences, returning one tuple of tagged tokens per sentence.
 
-        else:
-            return "NOUN"  # Default guess: noun (most common for unknowns)
+        Sentences repeated within or across batches are served from the tagging cache.
 
-    def tag_tokens(self, tokens: list[str]) -> list[tuple[str, str]]:
-        """Tag all tokens with POS and return the list of tuples.
         Args:
-            tokens: The list of words that make up the sentence.
+            sentences: The sentences to tag.
         """
-        tagged_tokens = []
-        if len(tokens) > 1:
-            for i, token in enumerate(tokens):
-                prev_token = tokens[i - 1] if i > 0 else None
-                next_token = tokens[i + 1] if i < len(tokens) - 1 else None
-                tagged_tokens.append(
-                    (
-                        token,
-                        self.get_pos(word=token, prev_word=prev_token, next_word=next_token),
-                    )
-                )
-        return tagged_tokens
-
-    def load_frame_from_tagged_tokens(self, tagged_tokens: list[tuple[str, str]]):
+        return list(map(_tag, sentences))
+
+    def load_frame_from_tagged_tokens(self, tagged_tokens: list[tuple[str, str, str]]):
         """Extract a sentence frame from tagged tokens.
 
         Args:
-            tagged_tokens: The list of tuples containing tokens and their part of speach (POS) tags.
+            tagged_tokens: The list of tuples containing tokens, their lower-cased forms and
+                their part of speach (POS) tags.
 
         References:
             - Frame extraction
@@ -884,22 +1118,31 @@ class SentenceReadingAgent:
             - Semantic Roles in NLP
                 https://www.geeksforgeeks.org/nlp/semantic-roles-in-nlp/
         """
-        verb_idx = None
-        for i, (word, pos) in enumerate(tagged_tokens):
-            if pos == "VERB":
-                verb_idx = i
-                self.frame["action"] = word
-                break
+        # Locate the predicate with C-level scans over the (interned) tag sequence.
+        tags = [pos for _, _, pos in tagged_tokens]
+        if "VERB" in tags:
+            verb_idx = tags.index("VERB")
         # fallback to AUX
-        if verb_idx is None:
-            for i, (word, pos) in enumerate(tagged_tokens):
-                if pos == "AUX":
-                    verb_idx = i
-                    self.frame["action"] = word
-                    break
-
-        if verb_idx is None:
+        elif "AUX" in tags:
+            verb_idx = tags.index("AUX")
+        else:
             return
+        frame = self.frame
+
+        # Bind the slot containers and their append methods once for the loops below.
+        agents = frame["agents"]
+        agents_append = agents.append
+        objects_append = frame["objects"].append
+        recipients_append = frame["recipients"].append
+        locations_append = frame["locations"].append
+        times_append = frame["times"].append
+        instruments_append = frame["instruments"].append
+        companions_append = frame["companions"].append
+        distances_append = frame["distances"].append
+        quantities_append = frame["quantities"].append
+        quantifiers_append = frame["quantifiers"].append
+        modifiers = frame["modifiers"]
+        names = frame["names"]
 
         # After verb → other roles based on prepositions
         current_prep = None
@@ -908,42 +1151,52 @@ class SentenceReadingAgent:
 
         # Before verb → agents with modifiers
 
+        # Both loops share one iterator, so the sentence is walked once without slicing.
+        # The predicate is only known after the locate scan above: the AUX fallback means
+        # a leading AUX stays in the before-verb part whenever a VERB follows it.
+        tokens = iter(tagged_tokens)
+
         # BEFORE VERB LOOP
         prev_word = None
+        prev_lower = None
         prev_pos = None
-        for word, pos in tagged_tokens[:verb_idx]:
+        for word, wl, pos in itertools.islice(tokens, verb_idx):
             if pos == "ADJ":
                 current_adj = word
             elif pos == "TIME":
-                if prev_word and prev_word.lower() in self.TIME_MARKERS:
-                    self.frame["times"].append(f"{prev_word} {word}")
+                if prev_word and prev_lower in self.TIME_MARKERS:
+                    times_append(f"{prev_word} {word}")
                 else:
-                    self.frame["times"].append(word)
-            elif pos == "PRON" and word.lower() in self.SUB_PRONOUNS:
-                self.frame["agents"].append(word)
+                    times_append(word)
+            elif pos == "PRON" and wl in self.SUB_PRONOUNS:
+                agents_append(word)
             elif pos == "PROPN":
                 # Appositive pattern: [NOUN] [PROPN] → name
                 if prev_pos == "NOUN":
-                    self.frame["names"][prev_word] = word
+                    names[prev_word] = word
                 else:
-                    self.frame["agents"].append(word)
+                    agents_append(word)
             elif pos == "NOUN":
-                self.frame["agents"].append(word)
+                agents_append(word)
                 if current_adj:
-                    self.frame["modifiers"][word] = current_adj
+                    modifiers[word] = current_adj
                     current_adj = None
             prev_word = word
+            prev_lower = wl
             prev_pos = pos
 
+        frame["action"] = next(tokens)[0]
+
         # AFTER VERB LOOP
         prev_word = None
-        for word, pos in tagged_tokens[verb_idx + 1 :]:
+        prev_lower = None
+        for word, wl, pos in tokens:
             # stop if the word is a clause marker.
-            if word.lower() in self.CLAUSE_MARKERS:
+            if wl in self.CLAUSE_MARKERS:
                 break
 
             if pos == "NUM":
-                if prev_word and prev_word.lower() in {"a", "an"}:
+                if prev_word and prev_lower in _INDEF_ART:
                     current_num = f"{prev_word} {word}"
                 # handle for non hyphenated compound numbers.
                 elif current_num:
@@ -951,72 +1204,156 @@ class SentenceReadingAgent:
                 else:
                     current_num = word
             elif pos == "ADP":
-                current_prep = word.lower()
+                current_prep = wl
             elif pos == "ADJ":
                 current_adj = word
             elif pos == "DET":
                 prev_word = word
+                prev_lower = wl
                 continue
             elif pos == "PRON":
-                if word.lower() in self.QUANTS:
-                    self.frame["quantifiers"].append(word)
-                if word.lower() in self.OBJ_PRONOUNS:
-                    self.frame["recipients"].append(word)
+                if wl in self.QUANTS:
+                    quantifiers_append(word)
+                if wl in self.OBJ_PRONOUNS:
+                    recipients_append(word)
             elif pos == "TIME":
-                if prev_word and prev_word.lower() in self.TIME_MARKERS:
-                    self.frame["times"].append(f"{prev_word} {word}")
+                if prev_word and prev_lower in self.TIME_MARKERS:
+                    times_append(f"{prev_word} {word}")
                 else:
-                    self.frame["times"].append(word)
+                    times_append(word)
 
             elif pos in ["NOUN", "PROPN"]:
                 # Handle directions as locations
-                if word.lower() in self.DIRECTIONS and current_prep is None:
-                    self.frame["locations"].append(word)
+                if wl in self.DIRECTIONS and current_prep is None:
+                    locations_append(word)
                     prev_word = word
+                    prev_lower = wl
                     continue
 
                 # Handle measure/quantity phrases like "3 feet" or "2 miles" or "a thousand dogs"
-                if current_num and word.lower() in self.DIST:
-                    self.frame["distances"].append(f"{current_num} {word}")
+                if current_num and wl in self.DIST:
+                    distances_append(f"{current_num} {word}")
                     current_num = None
                     current_prep = None
                     continue
                 elif current_num:
-                    self.frame["quantities"].append(f"{current_num} {word}")
+                    quantities_append(f"{current_num} {word}")
 
                 # Assign role based on preposition
                 if current_prep is None:
-                    self.frame["objects"].append(word)
+                    objects_append(word)
                 elif current_prep == "to":
                     if pos == "PROPN":
-                        self.frame["recipients"].append(word)
+                        recipients_append(word)
                     else:
-                        self.frame["locations"].append(word)
+                        locations_append(word)
                 elif current_prep == "of":
-                    self.frame["objects"].append(word)
+                    objects_append(word)
                 elif current_prep in ["at", "in", "on", "from"]:
-                    if current_prep == "on" and word.lower() in self.TIME_WORDS:
-                        self.frame["times"].append(word)
+                    if current_prep == "on" and wl in self.TIME_WORDS:
+                        times_append(word)
                     else:
-                        self.frame["locations"].append(word)
+                        locations_append(word)
                 elif current_prep == "with":
                     if pos == "PROPN":
-                        self.frame["companions"].append(word)
+                        companions_append(word)
                     else:
-                        self.frame["instruments"].append(word)
+                        instruments_append(word)
 
                 # Track adjective modifiers
                 if current_adj:
-                    self.frame["modifiers"][word] = current_adj
+                    modifiers[word] = current_adj
                     current_adj = None
 
                 current_prep = None
 
             prev_word = word
+            prev_lower = wl
 
         # Handle predicate adjectives: "The water is blue"
-        if current_adj and self.frame["agents"]:
-            self.frame["modifiers"][self.frame["agents"][-1]] = current_adj
+        if current_adj and agents:
+            modifiers[agents[-1]] = current_adj
+
+        for slot, key in (
+            ("agents", "last_agent"),
+            ("objects", "last_object"),
+            ("recipients", "last_recipient"),
+            ("locations", "last_location"),
+            ("times", "last_time"),
+        ):
+            if frame[slot]:
+                frame[key] = frame[slot][-1]
+
+    def _classify_who(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a WHO/WHOM question."""
+        # RULE: ditransitive: "Who was told/given/shown...?"
+        is_passive = "was" in token_set or "were" in token_set
+        if is_passive and not self.DITRANSITIVE.isdisjoint(token_set):
+            return "WHO_RECIPIENT"
+        # RULE: WHO + WITH anywhere (e.g., "Who does Lucy go with?")
+        if "with" in token_set:
+            return "WHO_WITH"
+        # RULE: WHO + trailing TO (e.g., "Who did Ada bring the note to?")
+        elif last_token == "to":
+            return "WHO_RECIPIENT"
+        else:
+            return "WHO_AGENT"
+
+    def _classify_what(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a WHAT question."""
+        if "name" in token_set:
+            return "WHAT_NAME"
+        elif next_token == "time":
+            return "WHEN"
+        # RULE: "What is [predicate]?""
+        elif next_token in _BE_WORDS:
+            return "WHAT_MODIFIER_NOUN"
+        # RULE: if the next token is a noun classifier.
+        elif next_token in _CLASSIFIER_NOUNS:
+            return "WHAT_MODIFIER_ADJ"
+        else:
+            return "WHAT_OBJECT"
+
+    def _classify_when(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a WHEN question."""
+        return "WHEN"
+
+    def _classify_where(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a WHERE question."""
+        return "WHERE"
+
+    def _classify_how(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a HOW question."""
+        if next_token in _QUANTITY_WORDS:
+            return "HOW_QUANTITY"
+        elif next_token == "far":
+            return "HOW_FAR"
+        elif next_token == "long":
+            return "HOW_LONG"
+        elif next_token == "often":
+            return "HOW_FREQUENCY"
+        elif next_token == "old":
+            return "HOW_OLD"
+        elif not self.W_MOVEMENT.isdisjoint(token_set):
+            return "HOW_METHOD"
+        else:
+            return "HOW"
+
+    def _classify_why(self, token_set: set[str], next_token: str, last_token: str) -> str:
+        """Classify a WHY question."""
+        return "WHY"
+
+    # WH word → rule method name; one hash picks the rules instead of a chain of compares.
+    # Names are resolved on the instance so subclass overrides take effect.
+    _WH_RULES = {
+        "who": "_classify_who",
+        "whom": "_classify_who",
+        "what": "_classify_what",
+        "when": "_classify_when",
+        "where": "_classify_where",
+        "why": "_classify_why",
+        "how": "_classify_how",
+    }
 
     def classify_question(self, question: str) -> str:
         """Classify the type of question.
@@ -1030,15 +1367,20 @@ class SentenceReadingAgent:
             - Answering Questions from text
                 https://campus.datacamp.com/courses/natural-language-processing-nlp-in-python/token-classification-and-text-generation?ex=5
         """
-        qst_lower = question.lower()
-        tokens = self.tokenize(qst_lower)
+        return self._classify_tokens(_question_tokens(question)[0])
+
+    def _classify_tokens(self, tokens: tuple[str, ...]) -> str:
+        """Classify a question from its lower-cased tokens.
 
+        Args:
+            tokens: The lower-cased question tokens.
+        """
         wh_idx = None
         wh_word = None
 
         # Step 1: Tokenize the question.
         for i, tok in enumerate(tokens):
-            if tok in {"who", "whom", "what", "where", "when", "why", "how"}:
+            if tok in self._WH_RULES:
                 wh_idx = i
                 wh_word = tok
                 break
@@ -1055,75 +1397,162 @@ class SentenceReadingAgent:
 
         # RULE: PREP + WH (e.g., "with whom", "at what time, to whom")
         if prev_token == "with":
-            if wh_word in {"who", "whom"}:
+            if wh_word in _WHO_WORDS:
                 return "WHO_WITH"
             else:
                 return "WITH_WHAT"
         if prev_token == "to":
             return "WHO_RECIPIENT"
-        # RULE: WHO
-        if wh_word in {"who", "whom"}:
-            # RULE: ditransitive: "Who was told/given/shown...?"
-            if ("was" in tokens or "were" in tokens) and (self.DITRANSITIVE & set(tokens)):
-                return "WHO_RECIPIENT"
-            # RULE: WHO + WITH anywhere (e.g., "Who does Lucy go with?")
-            if "with" in tokens:
-                return "WHO_WITH"
-            # RULE: WHO + trailing TO (e.g., "Who did Ada bring the note to?")
-            elif last_token == "to":
-                return "WHO_RECIPIENT"
-            else:
-                return "WHO_AGENT"
-        # RULE: WHAT
-        if wh_word == "what":
-            be_words = {"is", "was", "are", "were", "be", "been"}
-
-            if "name" in tokens:
-                return "WHAT_NAME"
-            elif next_token == "time":
-                return "WHEN"
-            # RULE: "What is [predicate]?""
-            elif next_token in be_words:
-                return "WHAT_MODIFIER_NOUN"
-            # RULE: if the next token is a noun classifier.
-            elif next_token in {
-                "color",
-                "animal",
-                "size",
-                "kind",
-                "type",
-                "shape",
-                "brand",
-                "style",
-            }:
-                return "WHAT_MODIFIER_ADJ"
-            else:
-                return "WHAT_OBJECT"
-        # RULE: WHEN
-        if wh_word == "when":
-            return "WHEN"
-        # RULE: WHERE
-        if wh_word == "where":
-            return "WHERE"
-        # RULE: HOW
-        if wh_word == "how":
-            if next_token in ["many", "much"]:
-                return "HOW_QUANTITY"
-            elif next_token == "far":
-                return "HOW_FAR"
-            elif next_token == "long":
-                return "HOW_LONG"
-            elif next_token == "often":
-                return "HOW_FREQUENCY"
-            elif next_token == "old":
-                return "HOW_OLD"
-            elif self.W_MOVEMENT & set(tokens):
-                return "HOW_METHOD"
-            else:
-                return "HOW"
-        # RULE: WHY
-        if wh_word == "why":
-            return "WHY"
+        # RULE: WH word specific rules
+        # The rules only test membership, so hash the question's tokens once for all of them.
+        return getattr(self, self._WH_RULES[wh_word])(set(tokens), next_token, last_token)
+
+    def _who_fallback(self) -> str:
+        """Answer a WHO question whose specific role slot is empty."""
+        # Fallback for existential sentences ("There are men")
+        if self.frame["objects"]:
+            return self.frame["objects"][0]
+        # Fall back to AGENT
+        if self.frame["agents"]:
+            return self.frame["agents"][0]
+        return ""
+
+    def _answer_who_agent(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHO_AGENT question."""
+        return self.frame["last_agent"] or self._who_fallback()
+
+    def _answer_who_recipient(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHO_RECIPIENT question."""
+        return self.frame["last_recipient"] or self._who_fallback()
+
+    def _answer_who_with(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHO_WITH question."""
+        for name in self.frame["agents"]:
+            if name.lower() not in q_words:
+                return name
+        if self.frame["agents"]:
+            return self.frame["agents"][0]
+        return self._who_fallback()
+
+    def _answer_what_name(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHAT_NAME question."""
+        agent = self.frame["agents"][-1]
+        if agent in self.frame["names"]:
+            return self.frame["names"][agent]
+        else:
+            return agent
+
+    def _answer_what_agent(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHAT_AGENT question."""
+        return self.frame["last_agent"] or self.frame["last_object"] or ""
+
+    def _answer_what_object(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHAT_OBJECT question."""
+        if self.frame["last_object"]:
+            return self.frame["last_object"]
+        elif self.frame["last_agent"]:
+            return self.frame["last_agent"]
+        # Fallback: look for predicate adjective
+        for word, _, pos in reversed(tagged_tokens):
+            if pos == "ADJ":
+                return word
+        return ""
+
+    def _answer_what_subject(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHAT_SUBJECT question."""
+        return self.frame["agents"][-1]
+
+    def _answer_what_modifier_noun(
+        self, question: str, q_words: frozenset, tagged_tokens: tuple
+    ) -> str:
+        """Answer a WHAT_MODIFIER_NOUN question ("What is [predicate]?")."""
+        # If agent mentioned in question → return object
+        for agent in self.frame["agents"]:
+            if agent.lower() in q_words:
+                if self.frame["last_object"]:
+                    return self.frame["last_object"]
+        # Otherwise return agent
+        return self.frame["last_agent"] or ""
+
+    def _answer_what_modifier_adj(
+        self, question: str, q_words: frozenset, tagged_tokens: tuple
+    ) -> str:
+        """Answer a WHAT_MODIFIER_ADJ question ("What color/animal ...?")."""
+        # Check if question token is a name → return noun
+        for noun, name in self.frame["names"].items():
+            if name.lower() in q_words:
+                return noun
+
+        for noun, modifier in self.frame["modifiers"].items():
+            # Check if question token is a noun → return its modifier
+            if noun.lower() in q_words:
+                return modifier
+            # Check if question token is a modifier → return its noun
+            if modifier.lower() in q_words:
+                return noun
+        return ""
+
+    def _answer_when(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHEN question."""
+        if self.frame["times"]:
+            # Prefer numeric time (8:00AM) over word time
+            for t in self.frame["times"]:
+                if self.TIME_PATTERN.fullmatch(t):
+                    return t
+        return self.frame["last_time"] or ""
+
+    def _answer_where(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a WHERE question."""
+        return self.frame["last_location"] or ""
+
+    def _answer_how_method(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a HOW_METHOD question."""
+        if self.frame["action"]:
+            return self.frame["action"]
+        return ""
+
+    def _answer_how_far(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a HOW_FAR question."""
+        if self.frame["distances"]:
+            return self.frame["distances"][-1]
+        return ""
+
+    def _answer_how_modifier(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a HOW_LONG or HOW_OLD question from the noun's modifier."""
+        q_tokens = self.tokenize(question)
+        for token in q_tokens:
+            if token in self.frame["modifiers"]:
+                return self.frame["modifiers"][token]
+        return ""
+
+    def _answer_how_quantity(self, question: str, q_words: frozenset, tagged_tokens: tuple) -> str:
+        """Answer a HOW_QUANTITY question."""
+        if self.frame["quantities"]:
+            return self.frame["quantities"][0]
+        if self.frame["quantifiers"]:
+            return self.frame["quantifiers"][0]
+        return ""
+
+    # Question type → answer handler name; types without a handler (WHY, HOW_FREQUENCY, ...)
+    # answer "". Names are resolved on the instance so subclass overrides take effect.
+    _ANSWERS = {
+        "WHO_AGENT": "_answer_who_agent",
+        "WHO_RECIPIENT": "_answer_who_recipient",
+        "WHO_WITH": "_answer_who_with",
+        "WHAT_NAME": "_answer_what_name",
+        "WHAT_AGENT": "_answer_what_agent",
+        "WHAT_OBJECT": "_answer_what_object",
+        "WHAT_SUBJECT": "_answer_what_subject",
+        "WHAT_MODIFIER_NOUN": "_answer_what_modifier_noun",
+        "WHAT_MODIFIER_ADJ": "_answer_what_modifier_adj",
+        "WHEN": "_answer_when",
+        "WHERE": "_answer_where",
+        "HOW_METHOD": "_answer_how_method",
+        "HOW_FAR": "_answer_how_far",
+        "HOW_LONG": "_answer_how_modifier",
+        "HOW_OLD": "_answer_how_modifier",
+        "HOW_QUANTITY": "_answer_how_quantity",
+    }
 
     def solve(self, sentence: str, question: str) -> str:
         """Answer the question based on the given sentence.
@@ -1131,129 +1560,24 @@ class SentenceReadingAgent:
             sentence: The sentence used to answer the question.
             question: The question that pplies to the sentence.
         """
-        tokens = self.tokenize(sentence)
-        tagged_tokens = self.tag_tokens(tokens)
-        print(f"tagged_tokens: {tagged_tokens}")
+        # Trace output is lazy: nothing is formatted unless DEBUG logging is enabled.
+        debug = _logger.isEnabledFor(logging.DEBUG)
+        tagged_tokens = _tag(sentence)
+        if debug:
+            _logger.debug("tagged_tokens: %r", tagged_tokens)
         self._create_frame()
         self.load_frame_from_tagged_tokens(tagged_tokens)
-        print(f"frame: {self.frame}")
-        q_type = self.classify_question(question)
-        print(f"q_type: {q_type}")
-
-        q_type_parts = q_type.split("_")
-        # do the 5w's in question types and then get subtypes from that.
-
-        # WHO
-        if q_type_parts[0] == "WHO":
-            if len(q_type_parts) > 1:
-                if q_type_parts[1] == "AGENT":
-                    if self.frame["agents"]:
-                        return self.frame["agents"][-1]
-                elif q_type_parts[1] == "RECIPIENT":
-                    if self.frame["recipients"]:
-                        return self.frame["recipients"][-1]
-                elif q_type_parts[1] == "WITH":
-                    for name in self.frame["agents"]:
-                        if name.lower() not in question.lower():
-                            return name
-                    if self.frame["agents"]:
-                        return self.frame["agents"][0]
-                # Fallback for existential sentences ("There are men")
-                if self.frame["objects"]:
-                    return self.frame["objects"][0]
-                # Fall back to AGENT
-                if self.frame["agents"]:
-                    return self.frame["agents"][0]
-
-        # WHAT
-        elif q_type_parts[0] == "WHAT":
-            if len(q_type_parts) > 1:
-                if q_type_parts[1] == "NAME":
-                    agent = self.frame["agents"][-1]
-                    if agent in self.frame["names"]:
-                        return self.frame["names"][agent]
-                    else:
-                        return agent
-                elif q_type_parts[1] == "AGENT":
-                    if self.frame["agents"]:
-                        return self.frame["agents"][-1]
-                    elif self.frame["objects"]:
-                        return self.frame["objects"][-1]
-                elif q_type_parts[1] == "OBJECT":
-                    if self.frame["objects"]:
-                        return self.frame["objects"][-1]
-                    elif self.frame["agents"]:
-                        return self.frame["agents"][-1]
-                    else:
-                        # Fallback: look for predicate adjective
-                        for word, pos in reversed(tagged_tokens):
-                            if pos == "ADJ":
-                                return word
-                elif q_type_parts[1] == "SUBJECT":
-                    return self.frame["agents"][-1]
-                elif q_type_parts[1] == "MODIFIER":
-                    if q_type_parts[2] == "NOUN":
-                        q_tokens = [t.lower() for t in self.tokenize(question)]
-                        # If agent mentioned in question → return object
-                        for agent in self.frame["agents"]:
-                            if agent.lower() in q_tokens:
-                                if self.frame["objects"]:
-                                    return self.frame["objects"][-1]
-                        # Otherwise return agent
-                        if self.frame["agents"]:
-                            return self.frame["agents"][-1]
-                    elif q_type_parts[2] == "ADJ":
-                        q_tokens = [t.lower() for t in self.tokenize(question)]
-
-                        # Check if question token is a name → return noun
-                        for noun, name in self.frame["names"].items():
-                            if name.lower() in q_tokens:
-                                return noun
-
-                        for noun, modifier in self.frame["modifiers"].items():
-                            # Check if question token is a noun → return its modifier
-                            if noun.lower() in q_tokens:
-                                return modifier
-                            # Check if question token is a modifier → return its noun
-                            if modifier.lower() in q_tokens:
-                                return noun
-
-        # WHEN
-        elif q_type_parts[0] == "WHEN":
-            if self.frame["times"]:
-                # Prefer numeric time (8:00AM) over word time
-                for t in self.frame["times"]:
-                    if self.TIME_PATTERN.match(t):
-                        return t
-                return self.frame["times"][-1]
-
-        # WHERE
-        elif q_type_parts[0] == "WHERE":
-            if self.frame["locations"]:
-                return self.frame["locations"][-1]
-
-        # WHY
-        elif q_type_parts[0] == "WHY":
-            pass
-
-        # HOW
-        elif q_type_parts[0] == "HOW":
-            if len(q_type_parts) > 1:
-                if q_type_parts[1] == "METHOD":
-                    if self.frame["action"]:
-                        return self.frame["action"]
-                elif q_type_parts[1] == "FAR":
-                    if self.frame["distances"]:
-                        return self.frame["distances"][-1]
-                elif q_type_parts[1] in ["LONG", "OLD"]:
-                    q_tokens = self.tokenize(question)
-                    for token in q_tokens:
-                        if token in self.frame["modifiers"]:
-                            return self.frame["modifiers"][token]
-                elif q_type_parts[1] == "QUANTITY":
-                    if self.frame["quantities"]:
-                        return self.frame["quantities"][0]
-                    if self.frame["quantifiers"]:
-                        return self.frame["quantifiers"][0]
+        if debug:
+            _logger.debug("frame: %r", self.frame)
+        # The question is lowered and tokenized once, and memoized, for both classification
+        # and answering.
+        q_tokens, q_words = _question_tokens(question)
+        q_type = self._classify_tokens(q_tokens)
+        if debug:
+            _logger.debug("q_type: %s", q_type)
 
-        return ""
+        # One hash picks the answer handler instead of a chain of type compares.
+        handler = self._ANSWERS.get(q_type)
+        if handler is None:
+            return ""
+        return getattr(self, handler)(question, q_words, tagged_tokens)
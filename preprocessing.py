@@ -1,31 +1,80 @@
+import contextlib
+import functools
+import json
+import os
+import string
+import sys
 from pathlib import Path
 
 import spacy
 
-KNOWN_NAMES = {
-    "ada",
-    "andrew",
-    "bobbie",
-    "cason",
-    "david",
-    "farzana",
-    "frank",
-    "hannah",
-    "ida",
-    "irene",
-    "jim",
-    "jose",
-    "keith",
-    "laura",
-    "lucy",
-    "meredith",
-    "nick",
-    "serena",
-    "yan",
-    "yeeling",
-}
-
-nlp = spacy.load("en_core_web_sm")
+try:
+    import orjson
+except ImportError:  # orjson is optional; the CLI falls back to the standard json module.
+    orjson = None
+
+KNOWN_NAMES = frozenset(
+    {
+        "ada",
+        "andrew",
+        "bobbie",
+        "cason",
+        "david",
+        "farzana",
+        "frank",
+        "hannah",
+        "ida",
+        "irene",
+        "jim",
+        "jose",
+        "keith",
+        "laura",
+        "lucy",
+        "meredith",
+        "nick",
+        "serena",
+        "yan",
+        "yeeling",
+    }
+)
+
+# Single punctuation characters are tagged PUNCT without running the pipeline.
+PUNCTUATION = frozenset(string.punctuation)
+
+# spaCy pipeline that tags the word list.
+SPACY_MODEL = "en_core_web_sm"
+
+# Version of the tagging rules in preprocess_word_list; bump it whenever they change the
+# output so caches written by older rules are not reused.
+CACHE_VERSION = 1
+
+# Documents per nlp.pipe batch; override with the SPACY_BATCH_SIZE environment variable.
+DEFAULT_SPACY_BATCH_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp() -> spacy.language.Language:
+    """Load the spaCy pipeline on first use and reuse it for the rest of the process."""
+    # Only POS tags and lemmas are read, so the parser and NER are never loaded.
+    return spacy.load(SPACY_MODEL, exclude=["parser", "ner"])
+
+
+def _spacy_batch_size() -> int:
+    """Read the nlp.pipe batch size from SPACY_BATCH_SIZE, defaulting to 1000.
+
+    Parsed when the word list is tagged rather than at import, so a bad value cannot break
+    importing this module.
+    """
+    value = os.environ.get("SPACY_BATCH_SIZE")
+    if value is None:
+        return DEFAULT_SPACY_BATCH_SIZE
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        raise ValueError(f"SPACY_BATCH_SIZE must be a positive integer, got {value!r}.")
+    return batch_size
 
 
 def preprocess_word_list(word_lst: str = "mostcommon.txt") -> dict:
@@ -49,10 +98,30 @@ def preprocess_word_list(word_lst: str = "mostcommon.txt") -> dict:
     if not common.exists():
         raise FileNotFoundError("mostcommon.txt does not exist.")
 
-    with common.open(mode="r") as f:
-        words = [line.strip() for line in f if line.strip()]
+    # Reuse the last result while the rules, word list, spaCy and the model are all unchanged.
+    cache = common.with_suffix(".cache.json")
+    # The model version comes from package metadata so a cache hit never loads the model.
+    # The rules version and the known names tie the cache to the tagging logic as well.
+    cache_key = [
+        CACHE_VERSION,
+        sorted(KNOWN_NAMES),
+        common.stat().st_mtime_ns,
+        spacy.__version__,
+        spacy.util.get_package_version(SPACY_MODEL),
+    ]
+    # A missing, truncated or older-format cache is treated as a miss.
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        cached = json.loads(cache.read_text(encoding="utf-8"))
+        if cached["key"] == cache_key:
+            return cached["word_info"]
+
+    # One read and one C-level strip per line instead of two strips per iterated line.
+    lines = common.read_text(encoding="utf-8").splitlines()
+    words = [word for word in map(str.strip, lines) if word]
 
     word_info = {}
+    # Case variants and repeats share one spaCy call: lower-cased word → its spellings.
+    spellings = {}
     for word in words:
         word_lower = word.lower()
         if word_lower in KNOWN_NAMES:
@@ -61,17 +130,47 @@ def preprocess_word_list(word_lst: str = "mostcommon.txt") -> dict:
                 "lemma": word_lower,  # Lemma: base form of the word ("brought" → "bring")
             }
             continue
+        # Numerals and punctuation are unambiguous, so they skip spaCy as well.
+        if word_lower.isdigit():
+            word_info[word] = {"pos": "NUM", "lemma": word_lower}
+            continue
+        if word in PUNCTUATION:
+            word_info[word] = {"pos": "PUNCT", "lemma": word}
+            continue
+        spellings.setdefault(word_lower, []).append(word)
 
-        # BEGIN CODE TAKEN FROM https://spacy.io/usage/linguistic-features
-        doc = nlp(word)
-        for token in doc:
-            word_info[word] = {
-                "pos": token.pos_,  # POS (Part of Speech): tells you if a word is a NOUN, VERB, ADJ, etc.
-                "lemma": token.lemma_,  # Lemma: base form of the word ("brought" → "bring")
-            }
+    # Tag the first spelling of each word in batches rather than paying the pipeline
+    # overhead per word, then fan the result out to every spelling.
+    to_tag = [variants[0] for variants in spellings.values()]
+    docs = _get_nlp().pipe(to_tag, batch_size=_spacy_batch_size())
+    # BEGIN CODE TAKEN FROM https://spacy.io/usage/linguistic-features
+    for variants, doc in zip(spellings.values(), docs, strict=True):
+        # Index the token directly; words that split (e.g. "don't" → "do" "n't") keep
+        # their last token, as the agent's lexicon expects ("don't" → PART "not").
+        token = doc[-1]
+        # Resolve the tag strings from the StringStore once, not once per spelling, and
+        # intern them so the handful of distinct POS tags share one object each.
+        # POS (Part of Speech): tells you if a word is a NOUN, VERB, ADJ, etc.
+        pos = sys.intern(token.pos_)
+        # Lemma: base form of the word ("brought" → "bring")
+        lemma = sys.intern(token.lemma_)
+        for word in variants:
+            word_info[word] = {"pos": pos, "lemma": lemma}
         # END CODE TAKEN FROM https://spacy.io/usage/linguistic-features
+
+    # Write a temporary file and swap it in so an interrupted run never leaves a partial
+    # cache; a failed write (e.g. a read-only directory) still returns the fresh result.
+    partial = cache.with_name(cache.name + ".tmp")
+    with contextlib.suppress(OSError):
+        partial.write_text(json.dumps({"key": cache_key, "word_info": word_info}), encoding="utf-8")
+        partial.replace(cache)
     return word_info
 
 
 if __name__ == "__main__":
-    print(preprocess_word_list())
+    # Dump JSON instead of the dict repr, serializing in C through orjson when it is installed.
+    word_info = preprocess_word_list()
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(word_info) + b"\n")
+    else:
+        sys.stdout.write(json.dumps(word_info) + "\n")